@@ -81,7 +81,7 @@ async def start_bot() -> dict[str, Any]:
     log.info("api.engine_started")
     return {
         "message": "Engine started",
-        "status": _engine.status.value,
+        "status": _engine.status.name.lower(),
     }
 
 
@@ -99,7 +99,7 @@ async def stop_bot() -> dict[str, Any]:
     log.info("api.engine_stopped")
     return {
         "message": "Engine stopped — all orders cancelled",
-        "status": _engine.status.value,
+        "status": _engine.status.name.lower(),
     }
 
 
@@ -131,8 +131,8 @@ async def get_orders() -> dict[str, Any]:
 @router.get("/uptime")
 async def get_uptime() -> dict[str, Any]:
     """Get uptime statistics."""
-    from app.uptime.tracker import uptime_tracker
-    return uptime_tracker.get_stats()
+    from app.uptime.tracker import get_uptime_tracker
+    return get_uptime_tracker().get_stats()
 
 
 # --- Config ---
@@ -164,8 +164,8 @@ async def update_config(config: ConfigUpdate) -> dict[str, Any]:
                 await _engine.stop()
 
             # 2. Reset uptime
-            from app.uptime.tracker import uptime_tracker
-            uptime_tracker.reset()
+            from app.uptime.tracker import get_uptime_tracker
+            get_uptime_tracker().reset()
 
             # 3. Switch WS subscription
             if _market_data_client is not None:
@@ -183,6 +183,9 @@ async def update_config(config: ConfigUpdate) -> dict[str, Any]:
                 sl_usd=config.sl_usd,
             )
 
+            if _engine is not None:
+                _engine.refresh_settings_view()
+
             # 5. Restart engine if it was running
             if was_running and _engine is not None:
                 await asyncio.sleep(1.0)  # Brief pause for new orderbook data
@@ -204,6 +207,9 @@ async def update_config(config: ConfigUpdate) -> dict[str, Any]:
             if not updates:
                 raise HTTPException(status_code=400, detail="No valid fields to update")
 
+            if _engine is not None:
+                _engine.refresh_settings_view()
+
             # Force refresh orders so new config takes effect immediately
             from app.trading.engine import BotStatus
             if _engine is not None and _engine.status == BotStatus.RUNNING:
@@ -8,9 +8,10 @@ Includes orderbook data (best bid/ask) in the payload.
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import Any
 
+import orjson
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from app.logger import get_logger
@@ -68,7 +69,10 @@ async def broadcast_loop() -> None:
             try:
                 state = _engine.get_full_status()
                 state["type"] = "state_update"
-                message = json.dumps(state, default=str)
+                # Serialized once per broadcast, fanned out to every
+                # client; orjson emits floats natively without the
+                # per-field default=str fallback.
+                message = orjson.dumps(state, default=str).decode()
 
                 disconnected: set[WebSocket] = set()
                 for client in _clients.copy():
@@ -46,6 +46,20 @@ class AuthManager:
             settings.standx_ed25519_private_key
         )
         self._token_set_at: float = time.time()
+        # Signer object built lazily on first signed request and reused.
+        # Key derivation (clamping + scalar precomputation) is the
+        # expensive part of ed25519 signing; the per-request uuid and
+        # timestamp make whole-signature caching impossible, but the
+        # derived key is constant for the process lifetime.
+        self._signer: Any = None
+        # The token comes from .env and never rotates at runtime, so the
+        # Authorization header can be built once instead of formatted on
+        # every request.
+        self._auth_header: dict[str, str] = (
+            {"Authorization": f"Bearer {self._access_token}"}
+            if self._access_token
+            else {}
+        )
 
         if self._access_token:
             log.info(
@@ -72,16 +86,21 @@ class AuthManager:
         return self._access_token
 
     async def get_auth_headers(self) -> dict[str, str]:
-        """Return Authorization header."""
-        token = await self.get_token()
-        return {"Authorization": f"Bearer {token}"}
+        """Return a copy of the cached Authorization header."""
+        if not self._auth_header:
+            raise RuntimeError("Not authenticated — set STANDX_JWT_TOKEN in .env")
+        return dict(self._auth_header)
 
-    def sign_request_body(self, payload: str) -> dict[str, str]:
+    def sign_request_body(self, payload: str | bytes) -> dict[str, str]:
         """
         Sign a request body per StandX's body signature flow.
 
         Returns dict with x-request-* headers.
         Uses ed25519 signing of: v1,{requestId},{timestamp},{payload}
+
+        Accepts the payload as either str or pre-encoded bytes so hot
+        paths that already hold serialized bytes avoid a decode/encode
+        round-trip.
         """
         if self._ed25519_private_key_bytes is None:
             return {}
@@ -89,25 +108,36 @@ class AuthManager:
         version = "v1"
         request_id = str(uuid.uuid4())
         timestamp = int(time.time() * 1000)
-        message = f"{version},{request_id},{timestamp},{payload}"
-        message_bytes = message.encode("utf-8")
+        prefix = f"{version},{request_id},{timestamp},".encode("utf-8")
+        if isinstance(payload, bytes):
+            message_bytes = prefix + payload
+        else:
+            message_bytes = prefix + payload.encode("utf-8")
 
-        # Sign with ed25519
-        try:
-            from nacl.signing import SigningKey  # type: ignore
-            signing_key = SigningKey(self._ed25519_private_key_bytes)
-            signed = signing_key.sign(message_bytes)
-            signature_b64 = base64.b64encode(signed.signature).decode("utf-8")
-        except ImportError:
-            # Fallback: try using cryptography library
+        # Sign with ed25519, constructing the signer once and reusing it
+        if self._signer is None:
             try:
-                from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-                private_key = Ed25519PrivateKey.from_private_bytes(self._ed25519_private_key_bytes)
-                signature = private_key.sign(message_bytes)
-                signature_b64 = base64.b64encode(signature).decode("utf-8")
-            except Exception as e:
-                log.warning("auth.body_sign_failed", error=str(e))
-                return {}
+                from nacl.signing import SigningKey  # type: ignore
+                self._signer = SigningKey(self._ed25519_private_key_bytes)
+            except ImportError:
+                # Fallback: try using cryptography library
+                try:
+                    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+                    self._signer = Ed25519PrivateKey.from_private_bytes(
+                        self._ed25519_private_key_bytes
+                    )
+                except Exception as e:
+                    log.warning("auth.body_sign_failed", error=str(e))
+                    return {}
+
+        try:
+            signed = self._signer.sign(message_bytes)
+            # nacl returns a SignedMessage; cryptography returns raw bytes
+            signature = getattr(signed, "signature", signed)
+            signature_b64 = base64.b64encode(signature).decode("utf-8")
+        except Exception as e:
+            log.warning("auth.body_sign_failed", error=str(e))
+            return {}
 
         return {
             "x-request-sign-version": version,
@@ -116,7 +146,7 @@ class AuthManager:
             "x-request-signature": signature_b64,
         }
 
-    async def get_full_headers(self, payload: str = "") -> dict[str, str]:
+    async def get_full_headers(self, payload: str | bytes = "") -> dict[str, str]:
         """Get auth headers + body signature headers combined."""
         headers = await self.get_auth_headers()
         if payload:
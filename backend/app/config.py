@@ -87,6 +87,14 @@ class Settings(BaseSettings):
 
     # Auto-close partial-fill positions (reduce_only market order)
     auto_close_fills: bool = Field(default=True)
+    position_sync_interval: float = Field(default=1.0)  # Background position poll cadence
+
+    # Batch placement — single POST for bid+ask when the venue supports it
+    use_batch_orders: bool = Field(default=False)
+
+    # Logging — steady-state ticks coalesce into one engine.tick line
+    # per this many seconds; order-refresh ticks always log
+    log_every_seconds: float = Field(default=1.0)
 
     # Engine safety
     max_consecutive_failures: int = Field(default=5)
@@ -34,6 +34,10 @@ orderbook = Orderbook(symbol=settings.symbol)
 market_data_client = MarketDataClient(orderbook=orderbook)
 trading_engine = TradingEngine(orderbook=orderbook)
 
+# Position pushes from the authenticated WS feed the engine's cache;
+# REST reconciliation stays in the engine's sync loop.
+market_data_client.set_position_callback(trading_engine.on_position_update)
+
 # Wire up API references
 routes.set_engine(trading_engine)
 routes.set_orderbook(orderbook)
@@ -37,11 +37,18 @@ class MarketDataClient:
     ) -> None:
         self._orderbook = orderbook
         self._ws: Any = None
+        self._position_callback: Callable[[list[dict]], None] | None = None
         self._running = False
         self._task: asyncio.Task[None] | None = None
         self._reconnect_delay = 1.0
         self._max_reconnect_delay = 60.0
 
+    def set_position_callback(
+        self, callback: Callable[[list[dict]], None]
+    ) -> None:
+        """Register a sync callback for authenticated position pushes."""
+        self._position_callback = callback
+
     async def start(self) -> None:
         """Start the WebSocket connection loop."""
         self._running = True
@@ -204,8 +211,21 @@ class MarketDataClient:
             else:
                 log.error("ws_client.auth_failed", code=code, msg=msg)
 
-        # order/position/balance (authenticated user channels)
-        elif channel in ("order", "position", "balance", "trade"):
+        # position pushes feed the engine's cache so it doesn't have to
+        # poll REST between reconciliations
+        elif channel == "position":
+            pos_data = data.get("data", [])
+            if isinstance(pos_data, dict):
+                pos_data = [pos_data]
+            if self._position_callback is not None:
+                try:
+                    self._position_callback(pos_data)
+                except Exception as e:
+                    log.warning("ws_client.position_callback_error", error=str(e))
+            log.debug("ws_client.position", count=len(pos_data))
+
+        # order/balance (authenticated user channels)
+        elif channel in ("order", "balance", "trade"):
             log.debug("ws_client.user_channel", channel=channel,
                       data=str(data.get("data", {}))[:200])
 
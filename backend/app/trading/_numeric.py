@@ -0,0 +1,54 @@
+"""
+Pure numeric kernels for the quote path.
+
+Compiled with numba's ``@njit`` when the package is installed; numba is
+an optional dependency, so a no-op decorator keeps the plain-Python
+path working everywhere else. Kernels take and return only floats —
+no dataclasses, no settings — so they stay JIT-compilable.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:
+    def njit(*args, **kwargs):  # type: ignore[misc]
+        """Fallback decorator — leaves the function uncompiled."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def quote_terms(
+    mid_price: float,
+    spread_bps: float,
+    bid_notional: float,
+    ask_notional: float,
+) -> tuple[float, float, float, float, float, float]:
+    """Symmetric quote math around mid.
+
+    Returns (bid_price, ask_price, bid_size, ask_size,
+    bid_deviation_bps, ask_deviation_bps). Zero/negative mids yield
+    zero sizes and deviations, matching the scalar generate() behavior.
+    """
+    factor = spread_bps / 10000.0
+    bid_price = mid_price * (1.0 - factor)
+    ask_price = mid_price * (1.0 + factor)
+
+    if mid_price > 0:
+        bid_size = bid_notional / mid_price
+        ask_size = ask_notional / mid_price
+        bid_deviation = (mid_price - bid_price) / mid_price * 10000.0
+        ask_deviation = (ask_price - mid_price) / mid_price * 10000.0
+    else:
+        bid_size = 0.0
+        ask_size = 0.0
+        bid_deviation = 0.0
+        ask_deviation = 0.0
+
+    return bid_price, ask_price, bid_size, ask_size, bid_deviation, ask_deviation
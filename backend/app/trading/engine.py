@@ -12,46 +12,68 @@ Main loop:
 from __future__ import annotations
 
 import asyncio
-import json
 import math
 import time
+import types
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import Any
 
 import httpx
+import orjson
 
 from app.config import settings, QTY_TICKS, PRICE_TICKS
 from app.logger import get_logger
 from app.auth.jwt_auth import auth_manager
 from app.market_data.orderbook import Orderbook
 from app.trading.quote import Quote, quote_generator
-from app.uptime.tracker import uptime_tracker
+from app.uptime.tracker import get_uptime_tracker
 
 log = get_logger("engine")
 
 
-class BotStatus(str, Enum):
-    STARTING = "starting"
-    RUNNING = "running"
-    STOPPED = "stopped"
-    ERROR = "error"
-    KILLED = "killed"
+class BotStatus(IntEnum):
+    """Engine lifecycle state.
 
+    IntEnum so the main loop's state check is an identity compare
+    rather than str.__eq__; serialize with ``.name.lower()`` to keep
+    the JSON contract.
+    """
+    STARTING = 0
+    RUNNING = 1
+    STOPPED = 2
+    ERROR = 3
+    KILLED = 4
 
-@dataclass
+
+@dataclass(slots=True)
 class ActiveOrder:
-    """Tracked order placed by the bot."""
+    """Tracked order placed by the bot.
+
+    Slotted: orders are created and scanned every tick, and dropping
+    the per-instance ``__dict__`` shrinks them and speeds up the
+    attribute reads in the refresh scan.
+    """
     order_id: str
     side: str              # 'buy' or 'sell'
     price: float
     size: float
-    placed_at: float = field(default_factory=time.time)
+    # Monotonic placement time: age math must not jump with wall-clock
+    # adjustments, and reading the monotonic clock once per tick is
+    # cheaper than a wall-clock read per order.
+    placed_at: float = field(default_factory=time.monotonic)
+    placed_at_wall: float = field(default_factory=time.time)
     status: str = "open"
+    cancel_payload: bytes = b""   # pre-serialized cancel body, set at placement
+    price_ticks: int = 0           # price as integer ticks for the proximity scan
+    synthetic_id: bool = False     # locally fabricated id — unusable for cancels
 
-    def is_stale(self, max_age: float) -> bool:
-        return (time.time() - self.placed_at) > max_age
+    def is_stale(self, max_age: float, now: float | None = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        return (now - self.placed_at) > max_age
 
     def deviation_from_mid(self, mid: float) -> float:
         if mid == 0:
@@ -70,9 +92,9 @@ class ActiveOrder:
             "side": self.side,
             "price": round(self.price, 8),
             "size": round(self.size, 8),
-            "placed_at": self.placed_at,
+            "placed_at": self.placed_at_wall,
             "status": self.status,
-            "age_seconds": round(time.time() - self.placed_at, 1),
+            "age_seconds": round(time.monotonic() - self.placed_at, 1),
         }
 
 
@@ -81,31 +103,153 @@ class TradingEngine:
 
     def __init__(self, orderbook: Orderbook) -> None:
         self._orderbook = orderbook
+        self._uptime_tracker = get_uptime_tracker()
         self._status = BotStatus.STOPPED
-        self._active_orders: dict[str, ActiveOrder] = {}
+        # Open orders indexed by side — the tick loop only ever needs
+        # per-side views, so keep them separated instead of re-scanning
+        # one flat dict. Closed orders go to a bounded audit trail.
+        self._open_bids: dict[str, ActiveOrder] = {}
+        self._open_asks: dict[str, ActiveOrder] = {}
+        # Side string -> book, so placement picks its book with one dict
+        # lookup instead of a string-compare branch.
+        self._book_for_side = {"buy": self._open_bids, "sell": self._open_asks}
+        self._closed_orders: deque[dict] = deque(maxlen=256)
         self._consecutive_failures = 0
         self._task: asyncio.Task[None] | None = None
+        self._position_task: asyncio.Task[None] | None = None
         self._last_quote: Quote | None = None
         self._loop_count = 0
         self._open_position: dict | None = None  # {side, qty, entry_price}
+        self._last_pos_key: tuple | None = None    # last processed position fingerprint
+        # Positions-response extractor, specialized to the shape seen on
+        # the first successful poll (list vs {result}/{data} envelope).
+        self._positions_extractor: Any = None
+        # Cleared at runtime if the venue rejects the batch endpoint, so
+        # we only pay the failed probe once per process.
+        self._batch_supported = settings.use_batch_orders
+        self._bulk_cancel_supported = True
+        # Position snapshots pushed over the user WebSocket; REST stays
+        # as the periodic reconciliation path.
+        self._ws_positions: list[dict] | None = None
+        self._ws_positions_at = 0.0
+        self._last_pos_reconcile = 0.0
         self._closed_positions: list[dict] = []    # recent auto-closed positions
         self._tp_sl_order_ids: set[int] = set()    # tracked TP/SL reduce-only order IDs
         self._total_volume_usd: float = 0.0        # all-time trade volume from API
         self._last_volume_fetch: float = 0.0       # timestamp of last volume fetch
+        self._last_tick_mid: float | None = None   # mid at previous tick (prefetch heuristic)
+        self._last_tick_fingerprint: tuple | None = None  # keep-alive fast-path key
+        self._last_tick_log = 0.0                  # monotonic time of last tick log
+        self._last_tick_refreshed = True           # did last tick touch orders?
+        self._earliest_placed_mono: float = math.inf  # oldest open order (monotonic)
+        self._orders_view_cache: list[dict] | None = None  # cached active_orders payload
+        self._status_cache: tuple[float, dict] | None = None  # (built_at, payload)
         self._lock = asyncio.Lock()
+        self._settings_view = self._snapshot_settings()
+        self._rebuild_payload_templates()
+        self._rebuild_static_status()
+        # Tuned pool: the tick loop bursts several requests back to back,
+        # so keep connections warm and multiplex them over HTTP/2.
         self._client = httpx.AsyncClient(
             base_url=settings.standx_api_base,
-            timeout=10.0,
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=40,
+                keepalive_expiry=30.0,
+            ),
             verify=False,
         )
 
+    @staticmethod
+    def _snapshot_settings() -> types.SimpleNamespace:
+        """Snapshot the settings attributes read by get_full_status.
+
+        Pydantic attribute access is not free; the status endpoint is
+        polled by the frontend, so read settings once per config change
+        instead of ~10 times per call.
+        """
+        return types.SimpleNamespace(
+            symbol=settings.symbol,
+            spread_bps=settings.spread_bps,
+            bid_notional=settings.bid_notional,
+            ask_notional=settings.ask_notional,
+            requote_threshold_bps=settings.requote_threshold_bps,
+            refresh_interval=settings.refresh_interval,
+            tp_usd=settings.tp_usd,
+            sl_usd=settings.sl_usd,
+            auto_close_fills=settings.auto_close_fills,
+            max_notional=settings.max_notional,
+        )
+
+    def _rebuild_payload_templates(self) -> None:
+        """Prebuild the constant-per-run parts of order payloads.
+
+        Only side/qty/price change between placements; rebuilding the
+        full 7-key dict twice per tick is avoidable allocator churn.
+        """
+        self._order_tmpl = {
+            "symbol": settings.symbol,
+            "order_type": "limit",
+            "time_in_force": "gtc",
+            "reduce_only": False,
+        }
+        self._market_close_tmpl = {
+            "symbol": settings.symbol,
+            "order_type": "market",
+            "time_in_force": "ioc",
+            "reduce_only": True,
+        }
+        # Tick params depend only on symbol; resolve once per (re)build
+        # instead of on every placement.
+        self._qty_tick = QTY_TICKS.get(settings.symbol, 0.0001)
+        self._qty_decimals = max(0, -int(math.log10(self._qty_tick)))
+        self._price_tick = PRICE_TICKS.get(settings.symbol, 0.01)
+        self._price_decimals = max(0, -int(math.log10(self._price_tick)))
+        self._price_scale = 10 ** self._price_decimals
+
+    def refresh_settings_view(self) -> None:
+        """Re-snapshot settings after a runtime config update."""
+        self._settings_view = self._snapshot_settings()
+        quote_generator.reconfigure()
+        self._rebuild_payload_templates()
+        self._rebuild_static_status()
+
+    def _rebuild_static_status(self) -> None:
+        """Prebuild the settings-derived slice of the status payload.
+
+        These fields only change on config updates; merging a ready
+        dict per status poll beats re-reading nine settings attributes.
+        """
+        view = self._settings_view
+        self._static_status = {
+            "symbol": view.symbol,
+            "configured_spread_bps": view.spread_bps,
+            "bid_notional": view.bid_notional,
+            "ask_notional": view.ask_notional,
+            "requote_threshold_bps": view.requote_threshold_bps,
+            "refresh_interval": view.refresh_interval,
+            "tp_usd": view.tp_usd,
+            "sl_usd": view.sl_usd,
+            "auto_close_fills": view.auto_close_fills,
+        }
+
     @property
     def status(self) -> BotStatus:
         return self._status
 
     @property
     def active_orders(self) -> list[dict]:
-        return [o.to_dict() for o in self._active_orders.values() if o.status == "open"]
+        # Rebuilt lazily — every order mutation clears the cache, so
+        # repeated status polls between ticks don't re-serialize.
+        if self._orders_view_cache is None:
+            self._orders_view_cache = [
+                o.to_dict()
+                for book in (self._open_bids, self._open_asks)
+                for o in book.values()
+            ]
+        return self._orders_view_cache
 
     @property
     def last_quote(self) -> dict | None:
@@ -114,7 +258,7 @@ class TradingEngine:
     async def start(self) -> None:
         """Start the trading engine loop."""
         async with self._lock:
-            if self._status == BotStatus.RUNNING:
+            if self._status is BotStatus.RUNNING:
                 log.warning("engine.already_running")
                 return
             self._status = BotStatus.RUNNING
@@ -122,12 +266,16 @@ class TradingEngine:
             # Fetch all-time trade volume on startup
             await self._fetch_total_volume()
             self._task = asyncio.create_task(self._main_loop())
+            if settings.auto_close_fills:
+                self._position_task = asyncio.create_task(
+                    self._position_sync_loop()
+                )
             log.info("engine.started")
 
     async def stop(self) -> None:
         """Gracefully stop the engine and cancel all orders."""
         async with self._lock:
-            if self._status == BotStatus.STOPPED:
+            if self._status is BotStatus.STOPPED:
                 log.warning("engine.already_stopped")
                 return
             self._status = BotStatus.STOPPED
@@ -137,6 +285,13 @@ class TradingEngine:
                     await self._task
                 except asyncio.CancelledError:
                     pass
+            if self._position_task and not self._position_task.done():
+                self._position_task.cancel()
+                try:
+                    await self._position_task
+                except asyncio.CancelledError:
+                    pass
+            self._position_task = None
             await self._cancel_all_orders()
             self._last_quote = None
             self._consecutive_failures = 0
@@ -154,33 +309,50 @@ class TradingEngine:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        if self._position_task and not self._position_task.done():
+            self._position_task.cancel()
+            try:
+                await self._position_task
+            except asyncio.CancelledError:
+                pass
+        self._position_task = None
         log.info("engine.killed")
 
+    # Status payload TTL — collapses dashboard poll bursts between ticks
+    STATUS_CACHE_SECONDS = 0.25
+
     def get_full_status(self) -> dict[str, Any]:
-        """Return comprehensive engine status."""
-        uptime_stats = uptime_tracker.get_stats()
+        """Return comprehensive engine status.
+
+        Memoized for STATUS_CACHE_SECONDS and invalidated at the end of
+        every tick, so rapid dashboard polling doesn't rebuild the same
+        payload while nothing has changed. Callers get a shallow copy —
+        both the /status route and the WS broadcast add their own keys,
+        which must not leak into each other through the cache.
+        """
+        now = time.monotonic()
+        if (
+            self._status_cache is not None
+            and (now - self._status_cache[0]) < self.STATUS_CACHE_SECONDS
+        ):
+            return dict(self._status_cache[1])
+
+        uptime_stats = self._uptime_tracker.get_stats()
         quote_dict = self.last_quote or {}
-        return {
-            "status": self._status.value,
-            "symbol": settings.symbol,
+        spread_bps = self._static_status["configured_spread_bps"]
+        status = {
+            **self._static_status,
+            "status": self._status.name.lower(),
             "mid_price": self._orderbook.mid_price,
             "best_bid": self._orderbook.best_bid,
             "best_ask": self._orderbook.best_ask,
             "market_spread_bps": self._orderbook.spread_bps,
-            "configured_spread_bps": settings.spread_bps,
-            "bid_notional": settings.bid_notional,
-            "ask_notional": settings.ask_notional,
-            "requote_threshold_bps": settings.requote_threshold_bps,
-            "bid_spread_bps": quote_dict.get("bid_spread_bps", settings.spread_bps),
-            "ask_spread_bps": quote_dict.get("ask_spread_bps", settings.spread_bps),
-            "refresh_interval": settings.refresh_interval,
-            "tp_usd": settings.tp_usd,
-            "sl_usd": settings.sl_usd,
-            "auto_close_fills": settings.auto_close_fills,
+            "bid_spread_bps": quote_dict.get("bid_spread_bps", spread_bps),
+            "ask_spread_bps": quote_dict.get("ask_spread_bps", spread_bps),
             "open_position": self._open_position,
             "closed_positions": self._closed_positions[-20:],
             "active_orders": self.active_orders,
-            "active_order_count": len([o for o in self._active_orders.values() if o.status == "open"]),
+            "active_order_count": len(self._open_bids) + len(self._open_asks),
             "last_quote": self.last_quote,
             "loop_count": self._loop_count,
             "consecutive_failures": self._consecutive_failures,
@@ -189,12 +361,21 @@ class TradingEngine:
             "uptime_percentage": uptime_stats.get("current_hour", {}).get("maker_uptime_pct", 0),
             "mm_uptime_percentage": uptime_stats.get("current_hour", {}).get("mm_uptime_pct", 0),
         }
+        self._status_cache = (now, status)
+        return dict(status)
 
     # ─── Main Loop ────────────────────────────────────────────────
 
     async def _main_loop(self) -> None:
-        """Primary trading loop."""
-        while self._status == BotStatus.RUNNING:
+        """Primary trading loop.
+
+        Paced against monotonic deadlines rather than sleeping a full
+        interval after each tick, so tick latency doesn't drift the
+        cadence: a slow tick shortens the following sleep instead of
+        pushing every subsequent tick later.
+        """
+        next_deadline = time.monotonic()
+        while self._status is BotStatus.RUNNING:
             try:
                 await self._tick()
                 self._consecutive_failures = 0
@@ -217,22 +398,84 @@ class TradingEngine:
                     await self._cancel_all_orders()
                     break
 
-            await asyncio.sleep(settings.refresh_interval)
+            next_deadline += settings.refresh_interval
+            delay = next_deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                # Tick overran the interval — run again immediately (but
+                # still yield) and re-anchor so we don't sprint to catch up.
+                next_deadline = time.monotonic()
+                await asyncio.sleep(0)
+
+    # REST reconciliation cadence when WS position pushes are flowing
+    POSITION_RECONCILE_SECONDS = 30.0
+
+    async def _position_sync_loop(self) -> None:
+        """Process positions on their own cadence, decoupled from ticks.
+
+        Prefers position snapshots pushed over the authenticated
+        WebSocket (zero RTT, no signing); REST is kept as a cold
+        reconciliation path every POSITION_RECONCILE_SECONDS for drift
+        correction or when the WS cache is stale. Failures here are
+        logged and retried next interval; they never trip the engine's
+        failure counter.
+        """
+        while self._status is BotStatus.RUNNING:
+            try:
+                now = time.monotonic()
+                ws_fresh = (
+                    self._ws_positions is not None
+                    and (now - self._ws_positions_at)
+                    <= max(2.0 * settings.position_sync_interval, 5.0)
+                )
+                if ws_fresh and (
+                    (now - self._last_pos_reconcile)
+                    < self.POSITION_RECONCILE_SECONDS
+                ):
+                    await self._check_and_close_positions(self._ws_positions)
+                else:
+                    await self._check_and_close_positions()
+                    self._last_pos_reconcile = now
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                log.error("engine.position_sync_error", error=str(e))
+            await asyncio.sleep(settings.position_sync_interval)
+
+    def on_position_update(self, positions: list[dict]) -> None:
+        """Cache a position snapshot pushed over the user WebSocket."""
+        self._ws_positions = positions
+        self._ws_positions_at = time.monotonic()
 
     async def _tick(self) -> None:
         """Single iteration of the trading loop."""
         self._loop_count += 1
 
-        # 0. Check and close any open positions from partial fills
-        if settings.auto_close_fills:
-            await self._check_and_close_positions()
+        mid = self._orderbook.mid_price
+
+        # 0. Prefetch open orders when a requote looks likely (mid moved
+        # > half the threshold) so the GET overlaps the quote decision.
+        # Position handling lives in _position_sync_loop on its own
+        # cadence; the tick no longer spends an RTT on it.
+        open_orders_task: asyncio.Task | None = None
+        if mid is not None and self._last_tick_mid is not None:
+            moved_bps = abs(mid - self._last_tick_mid) / mid * 10000.0
+            if moved_bps >= settings.requote_threshold_bps * 0.5:
+                open_orders_task = asyncio.create_task(self._fetch_open_orders())
+                # The prefetch may be discarded unconsumed; retrieve a
+                # failure here or asyncio warns "exception was never
+                # retrieved" on every unused failed prefetch.
+                open_orders_task.add_done_callback(self._log_prefetch_failure)
 
         # 1. Get mid price
-        mid = self._orderbook.mid_price
         if mid is None:
+            if open_orders_task is not None:
+                open_orders_task.cancel()
             log.debug("engine.no_mid_price")
-            uptime_tracker.tick(has_both_sides=False)
+            self._uptime_tracker.tick(has_both_sides=False)
             return
+        self._last_tick_mid = mid
 
         best_bid = self._orderbook.best_bid
         best_ask = self._orderbook.best_ask
@@ -242,100 +485,228 @@ class TradingEngine:
         self._last_quote = quote
 
         if not quote.is_within_max_deviation:
-            log.warning("engine.quote_exceeds_deviation", quote=quote.to_dict())
-            uptime_tracker.tick(has_both_sides=False)
+            if open_orders_task is not None:
+                open_orders_task.cancel()
+            # Scalar kwargs — quote.to_dict() built an 11-key dict with
+            # eight rounds just to feed a log argument.
+            log.warning(
+                "engine.quote_exceeds_deviation",
+                mid=mid,
+                bid=quote.bid_price,
+                ask=quote.ask_price,
+                bid_dev=quote.bid_deviation_bps,
+                ask_dev=quote.ask_deviation_bps,
+            )
+            self._uptime_tracker.tick(has_both_sides=False)
             return
 
         # 3. Check if existing orders need refreshing
-        open_bids = {oid: o for oid, o in self._active_orders.items()
-                     if o.side == "buy" and o.status == "open"}
-        open_asks = {oid: o for oid, o in self._active_orders.items()
-                     if o.side == "sell" and o.status == "open"}
-
-        need_refresh = False
+        open_bids = self._open_bids
+        open_asks = self._open_asks
+
+        # Hoist tick-wide constants: one monotonic clock read and one
+        # proximity offset shared by both side scans. Monotonic so a
+        # wall-clock jump can't mark every order stale at once.
+        now = time.monotonic()
+
+        # Keep-alive fast path: if the quote targets and touch prices are
+        # byte-for-byte what the previous tick already scanned, the order
+        # set was not touched last tick, and nothing can have gone stale
+        # yet, the scans would reach the same "leave everything alone"
+        # verdict — skip them.
+        fingerprint = (
+            round(quote.bid_price, 2),
+            round(quote.ask_price, 2),
+            best_bid,
+            best_ask,
+        )
+        keep_alive = (
+            fingerprint == self._last_tick_fingerprint
+            and not self._last_tick_refreshed
+            and bool(open_bids)
+            and bool(open_asks)
+            and (now - self._earliest_placed_mono) <= settings.stale_order_seconds
+        )
+        self._last_tick_fingerprint = fingerprint
 
-        # Check bid side
-        for oid, order in open_bids.items():
-            proximity_hit = (best_bid is not None and
-                             order.price >= best_bid - (mid * settings.proximity_guard_bps / 10000.0))
-            drift_bps = abs(order.price - quote.bid_price) / mid * 10000.0
+        if keep_alive:
+            need_place_bid = need_place_ask = False
+        else:
+            # Proximity compares run on integer ticks — prices are tick
+            # rounded anyway, and an int compare per order beats the
+            # float multiply/subtract chain.
+            scale = self._price_scale
+            proximity_ticks = int(
+                mid * settings.proximity_guard_bps * scale / 10000.0
+            )
+            # Absolute price band equivalent to the bps threshold — one
+            # subtract+compare per order instead of an abs/div/mul chain.
+            drift_band = mid * settings.requote_threshold_bps / 10000.0
+            best_bid_ticks = (
+                round(best_bid * scale) if best_bid is not None else None
+            )
+            best_ask_ticks = (
+                round(best_ask * scale) if best_ask is not None else None
+            )
+            # One compare against the oldest open order answers "can
+            # anything be stale?" for the whole tick — the per-order
+            # checks only run in the rare tick where it says yes.
+            stale_possible = (
+                (now - self._earliest_placed_mono)
+                > settings.stale_order_seconds
+            )
+            need_refresh_bid = self._scan_side_for_refresh(
+                open_bids, "bid", quote.bid_price, best_bid_ticks, mid,
+                proximity_ticks, drift_band, now, stale_possible
+            )
+            need_refresh_ask = self._scan_side_for_refresh(
+                open_asks, "ask", quote.ask_price, best_ask_ticks, mid,
+                proximity_ticks, drift_band, now, stale_possible
+            )
 
-            if proximity_hit:
-                log.info("engine.proximity_guard_bid", order_id=oid,
-                         order_price=order.price, best_bid=best_bid)
-                need_refresh = True
-            elif drift_bps >= settings.requote_threshold_bps:
-                log.info("engine.requote_bid", order_id=oid, drift_bps=round(drift_bps, 2))
-                need_refresh = True
-            elif order.is_stale(settings.stale_order_seconds):
-                log.info("engine.cancel_stale_bid", order_id=oid)
-                need_refresh = True
-
-        # Check ask side
-        for oid, order in open_asks.items():
-            proximity_hit = (best_ask is not None and
-                             order.price <= best_ask + (mid * settings.proximity_guard_bps / 10000.0))
-            drift_bps = abs(order.price - quote.ask_price) / mid * 10000.0
+            # 4. Refresh only the side(s) that need it — a still-valid quote
+            # on the other side stays live on the book (cancel+replace costs
+            # RTT and uptime).
+            need_place_bid = need_refresh_bid or not open_bids
+            need_place_ask = need_refresh_ask or not open_asks
+        self._last_tick_refreshed = need_place_bid or need_place_ask
 
-            if proximity_hit:
-                log.info("engine.proximity_guard_ask", order_id=oid,
-                         order_price=order.price, best_ask=best_ask)
-                need_refresh = True
-            elif drift_bps >= settings.requote_threshold_bps:
-                log.info("engine.requote_ask", order_id=oid, drift_bps=round(drift_bps, 2))
-                need_refresh = True
-            elif order.is_stale(settings.stale_order_seconds):
-                log.info("engine.cancel_stale_ask", order_id=oid)
-                need_refresh = True
-
-        # 4. If refresh needed or no orders exist, cancel all and place new
-        has_both_sides = bool(open_bids) and bool(open_asks)
-
-        if need_refresh or not has_both_sides:
+        if need_place_bid and need_place_ask:
             if open_bids or open_asks:
-                # Cancel all existing orders on exchange
-                await self._cancel_all_orders()
-
-            # Place fresh orders
+                # Both sides going anyway — cancel everything on exchange.
+                # Cancels must finish before placing: _cancel_all_orders
+                # queries open orders and would sweep up fresh quotes.
+                await self._cancel_all_orders(open_orders_task)
+                open_orders_task = None
+            # Place both sides — one signed batch POST when supported,
+            # otherwise concurrently via TaskGroup, which propagates
+            # cancellation cleanly on stop()/kill().
+            placed_via_batch = False
+            if self._batch_supported:
+                placed_via_batch = await self._place_orders_batch([
+                    ("buy", quote.bid_price, quote.bid_size),
+                    ("sell", quote.ask_price, quote.ask_size),
+                ])
+            if not placed_via_batch:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self._place_order("buy", quote.bid_price, quote.bid_size))
+                    tg.create_task(self._place_order("sell", quote.ask_price, quote.ask_size))
+        elif need_place_bid:
+            await self._cancel_side_orders(open_bids)
             await self._place_order("buy", quote.bid_price, quote.bid_size)
+        elif need_place_ask:
+            await self._cancel_side_orders(open_asks)
             await self._place_order("sell", quote.ask_price, quote.ask_size)
 
+        if open_orders_task is not None:
+            # Prefetch turned out unnecessary this tick
+            open_orders_task.cancel()
+
         # 5. Update uptime — both sides active?
-        open_orders = [o for o in self._active_orders.values() if o.status == "open"]
-        has_active_bid = any(o.side == "buy" for o in open_orders)
-        has_active_ask = any(o.side == "sell" for o in open_orders)
-        uptime_tracker.tick(
+        has_active_bid = bool(self._open_bids)
+        has_active_ask = bool(self._open_asks)
+        self._uptime_tracker.tick(
             has_both_sides=has_active_bid and has_active_ask,
             spread_bps=settings.spread_bps,
         )
 
-        log.info(
-            "engine.tick",
-            loop=self._loop_count,
-            mid=round(mid, 4),
-            bid=round(quote.bid_price, 4),
-            ask=round(quote.ask_price, 4),
-            bid_spread=round(quote.bid_spread_bps, 2),
-            ask_spread=round(quote.ask_spread_bps, 2),
-            active_orders=len(open_orders),
-            maker_uptime_pct=round(uptime_tracker.current_maker_uptime_pct, 2),
-            mm_uptime_pct=round(uptime_tracker.current_mm_uptime_pct, 2),
-        )
+        # Fresh tick state supersedes any memoized status payload.
+        self._status_cache = None
+
+        # Steady-state ticks are uninteresting; render the structured
+        # line only on refresh ticks or once per log_every_seconds.
+        if self._last_tick_refreshed or (
+            (now - self._last_tick_log) >= settings.log_every_seconds
+        ):
+            self._last_tick_log = now
+            log.info(
+                "engine.tick",
+                loop=self._loop_count,
+                mid=mid,
+                bid=quote.bid_price,
+                ask=quote.ask_price,
+                bid_spread=quote.bid_spread_bps,
+                ask_spread=quote.ask_spread_bps,
+                active_orders=len(self._open_bids) + len(self._open_asks),
+                maker_uptime_pct=self._uptime_tracker.current_maker_uptime_pct,
+                mm_uptime_pct=self._uptime_tracker.current_mm_uptime_pct,
+            )
+
+    def _scan_side_for_refresh(
+        self,
+        orders: dict[str, ActiveOrder],
+        side_label: str,
+        target_price: float,
+        best_price_ticks: int | None,
+        mid: float,
+        proximity_ticks: int,
+        drift_band: float,
+        now: float,
+        stale_possible: bool = True,
+    ) -> bool:
+        """Scan one side's open orders for proximity/drift/stale triggers.
+
+        Returns True as soon as any order needs a refresh. Proximity is
+        a pure integer-tick compare; drift is an absolute-price-band
+        compare with the bps math deferred to the trigger path. With one
+        quote per side the scan is a handful of ops, so a tight scalar
+        loop with constants hoisted out beats any array/JIT machinery;
+        revisit only if layered grid quoting ever lands.
+        """
+        stale_seconds = settings.stale_order_seconds
+        is_bid = side_label == "bid"
+
+        for oid, order in orders.items():
+            if best_price_ticks is not None:
+                if is_bid:
+                    proximity_hit = (
+                        order.price_ticks >= best_price_ticks - proximity_ticks
+                    )
+                else:
+                    proximity_hit = (
+                        order.price_ticks <= best_price_ticks + proximity_ticks
+                    )
+            else:
+                proximity_hit = False
+
+            if proximity_hit:
+                log.info(f"engine.proximity_guard_{side_label}", order_id=oid,
+                         order_price=order.price,
+                         best_price_ticks=best_price_ticks)
+                return True
+
+            # drift_band is the bps threshold pre-scaled to price units;
+            # convert back to bps only on the (rare) trigger for the log.
+            if abs(order.price - target_price) >= drift_band:
+                drift_bps = abs(order.price - target_price) / mid * 10000.0
+                log.info(f"engine.requote_{side_label}", order_id=oid,
+                         drift_bps=round(drift_bps, 2))
+                return True
+
+            # Inline of ActiveOrder.is_stale — reuses the tick's single
+            # clock read, and skipped entirely when the oldest-order
+            # check already ruled staleness out for this tick.
+            if stale_possible and (now - order.placed_at) > stale_seconds:
+                log.info(f"engine.cancel_stale_{side_label}", order_id=oid)
+                return True
+
+        return False
 
     # ─── Order Management ─────────────────────────────────────────
 
-    async def _place_order(self, side: str, price: float, size: float) -> str | None:
-        """Place a limit order on StandX.
+    def _build_order_payload(
+        self, side: str, price: float, size: float
+    ) -> tuple[dict, float]:
+        """Round qty/price to symbol ticks and build the order body.
 
-        Returns order_id on success, None if skipped or soft-failed.
-        Only raises on transient errors (network, 5xx) — NOT on 400 qty errors.
+        Returns (payload, floored_qty). Shared by single and batch
+        placement so both apply identical tick rounding.
         """
         # Round qty to symbol's tick size
-        tick = QTY_TICKS.get(settings.symbol, 0.0001)
+        tick = self._qty_tick
         floored_qty = math.floor(size / tick) * tick
         # Round to avoid floating point artifacts
-        decimals = max(0, -int(math.log10(tick)))
-        floored_qty = round(floored_qty, decimals)
+        floored_qty = round(floored_qty, self._qty_decimals)
 
         if floored_qty < tick:
             # Notional too small — use minimum qty (1 tick) to keep uptime
@@ -349,49 +720,153 @@ class TradingEngine:
             )
 
         # Round price to symbol's price tick
-        price_tick = PRICE_TICKS.get(settings.symbol, 0.01)
-        price_decimals = max(0, -int(math.log10(price_tick)))
+        price_tick = self._price_tick
         if side == "buy":
             # Bid: floor to tick (lower = safer for buyer)
             rounded_price = math.floor(price / price_tick) * price_tick
         else:
             # Ask: ceil to tick (higher = safer for seller)
             rounded_price = math.ceil(price / price_tick) * price_tick
-        rounded_price = round(rounded_price, price_decimals)
 
         payload = {
-            "symbol": settings.symbol,
+            **self._order_tmpl,
             "side": side,
-            "order_type": "limit",
-            "qty": str(floored_qty),
-            "price": str(rounded_price),
-            "time_in_force": "gtc",
-            "reduce_only": False,
+            "qty": f"{floored_qty:.{self._qty_decimals}f}",
+            "price": f"{rounded_price:.{self._price_decimals}f}",
         }
+        return payload, floored_qty
+
+    def _track_order(
+        self, order_id: str, side: str, price: float, qty: float,
+        synthetic: bool = False,
+    ) -> None:
+        """Insert a freshly placed order into the side book."""
+        book = self._book_for_side[side]
+        order = ActiveOrder(
+            order_id=order_id,
+            side=side,
+            price=price,
+            size=qty,
+            cancel_payload=orjson.dumps({"order_id": order_id}),
+            price_ticks=round(price * self._price_scale),
+            synthetic_id=synthetic,
+        )
+        book[order_id] = order
+        if order.placed_at < self._earliest_placed_mono:
+            self._earliest_placed_mono = order.placed_at
+        self._orders_view_cache = None
+
+    async def _place_orders_batch(
+        self, specs: list[tuple[str, float, float]]
+    ) -> bool:
+        """Place several orders in one signed POST to the batch endpoint.
+
+        One request halves auth CPU and RTT versus per-order POSTs.
+        Returns False (and disables further batch attempts) if the venue
+        doesn't expose the endpoint, so the caller can fall back to the
+        per-order path.
+        """
+        built = [self._build_order_payload(side, price, size) for side, price, size in specs]
+        payload_bytes = orjson.dumps({"orders": [p for p, _ in built]})
+        headers = await auth_manager.get_full_headers(payload_bytes)
+        headers["Content-Type"] = "application/json"
+
+        try:
+            resp = await self._client.post(
+                "/api/new_order_batch",
+                content=payload_bytes,
+                headers=headers,
+            )
+            if resp.status_code in (404, 405):
+                log.warning("engine.batch_orders_unsupported")
+                self._batch_supported = False
+                return False
+            resp.raise_for_status()
+            # Past this point the orders are live on the exchange, so
+            # response-handling trouble must not report failure — the
+            # caller would re-place both sides on top of the live ones.
+            # Entries we cannot identify are tracked under flagged
+            # placeholder ids; the next refresh sweeps those via the
+            # query-based cancel path.
+            try:
+                data = orjson.loads(resp.content)
+                results = data if isinstance(data, list) else data.get(
+                    "result", data.get("data", [])
+                )
+                if not isinstance(results, list):
+                    results = []
+            except Exception as e:
+                log.warning("engine.batch_response_unparsable", error=str(e))
+                results = []
+            if len(results) < len(specs):
+                log.warning("engine.batch_response_short",
+                            expected=len(specs), got=len(results))
+            for i, ((side, price, _size), (_, floored_qty)) in enumerate(
+                zip(specs, built)
+            ):
+                entry = results[i] if i < len(results) else None
+                if not isinstance(entry, dict):
+                    entry = {}
+                order_id = entry.get("order_id") or entry.get("id")
+                synthetic = order_id is None
+                if synthetic:
+                    order_id = str(uuid.uuid4())
+                self._track_order(order_id, side, price, floored_qty,
+                                  synthetic=synthetic)
+                log.info("engine.order_placed", order_id=order_id, side=side,
+                         price=round(price, 2), size=floored_qty, batch=True)
+            return True
+        except httpx.HTTPStatusError as e:
+            log.error("engine.batch_orders_failed",
+                      status=e.response.status_code, body=e.response.text[:200])
+            self._batch_supported = False
+            return False
+        except Exception as e:
+            log.error("engine.batch_orders_error", error=str(e))
+            return False
+
+    async def _place_order(self, side: str, price: float, size: float) -> str | None:
+        """Place a limit order on StandX.
+
+        Returns order_id on success, None if skipped or soft-failed.
+        Only raises on transient errors (network, 5xx) — NOT on 400 qty errors.
+        """
+        # Inline notional guard — same check as
+        # risk_manager.check_can_place_order without the dispatch.
+        if size * price > self._settings_view.max_notional:
+            log.warning("engine.notional_blocked", side=side,
+                        notional=round(size * price, 2),
+                        max_notional=self._settings_view.max_notional)
+            return None
+
+        payload, floored_qty = self._build_order_payload(side, price, size)
 
         # TP/SL — removed: StandX API does NOT support tp_price/sl_price
         # TP/SL is now handled via separate reduce-only limit orders
         # placed by _place_tp_sl_orders() when a position is detected.
-        payload_str = json.dumps(payload)
-        headers = await auth_manager.get_full_headers(payload_str)
+        payload_bytes = orjson.dumps(payload)
+        headers = await auth_manager.get_full_headers(payload_bytes)
         headers["Content-Type"] = "application/json"
 
         try:
             resp = await self._client.post(
                 "/api/new_order",
-                content=payload_str,
+                content=payload_bytes,
                 headers=headers,
             )
             resp.raise_for_status()
-            data = resp.json()
-            order_id = data.get("order_id", data.get("id", str(uuid.uuid4())))
-
-            self._active_orders[order_id] = ActiveOrder(
-                order_id=order_id,
-                side=side,
-                price=price,
-                size=floored_qty,
-            )
+            data = orjson.loads(resp.content)
+            # Short-circuit: dict.get defaults evaluate eagerly, so the old
+            # data.get("order_id", data.get("id", str(uuid.uuid4()))) paid a
+            # urandom syscall on every successful placement. An absent id
+            # gets a fabricated placeholder, flagged so cancels know it
+            # cannot address the live order.
+            order_id = data.get("order_id") or data.get("id")
+            synthetic = order_id is None
+            if synthetic:
+                order_id = str(uuid.uuid4())
+
+            self._track_order(order_id, side, price, floored_qty, synthetic=synthetic)
             log.info("engine.order_placed", order_id=order_id, side=side,
                      price=round(price, 2), size=floored_qty)
             return order_id
@@ -410,10 +885,17 @@ class TradingEngine:
             log.error("engine.place_order_error", error=str(e))
             raise
 
-    async def _cancel_order_by_id(self, exchange_order_id: int) -> bool:
-        """Cancel a single order on the exchange using its integer ID."""
+    async def _cancel_order_by_id(
+        self, exchange_order_id: int, payload: bytes | None = None
+    ) -> bool:
+        """Cancel a single order on the exchange using its integer ID.
+
+        Tracked orders pass their pre-serialized cancel body; only
+        cancels for untracked exchange orders serialize here.
+        """
         try:
-            payload = json.dumps({"order_id": exchange_order_id})
+            if payload is None:
+                payload = orjson.dumps({"order_id": exchange_order_id})
             headers = await auth_manager.get_full_headers(payload)
             headers["Content-Type"] = "application/json"
             resp = await self._client.post(
@@ -440,39 +922,180 @@ class TradingEngine:
             log.error("engine.cancel_error", exchange_id=exchange_order_id, error=str(e))
             return False
 
-    async def _cancel_all_orders(self) -> None:
+    def _recompute_earliest_placed(self) -> None:
+        """Refresh the oldest-open-order timestamp after removals."""
+        self._earliest_placed_mono = min(
+            (
+                o.placed_at
+                for book in (self._open_bids, self._open_asks)
+                for o in book.values()
+            ),
+            default=math.inf,
+        )
+
+    def _archive_order(self, order: ActiveOrder) -> None:
+        """Push a lightweight record of a closed order onto the audit trail."""
+        self._closed_orders.append({
+            "order_id": order.order_id,
+            "side": order.side,
+            "price": order.price,
+            "size": order.size,
+            "placed_at": order.placed_at_wall,
+        })
+
+    async def _cancel_side_orders(self, orders: dict[str, ActiveOrder]) -> None:
+        """Cancel one side's tracked orders using their stored exchange IDs.
+
+        Tracked ids come from placement responses; when one is a
+        fabricated placeholder, or a cancel fails outright, the live
+        order cannot be trusted to be gone — re-query the exchange and
+        sweep that side by its real ids before clearing tracking, or a
+        leaked order sits alongside its replacement until the next
+        full cancel-all.
+        """
+        order_ids = list(orders)
+        side = next(iter(orders.values())).side if orders else None
+        trusted = [oid for oid in order_ids if not orders[oid].synthetic_id]
+        results = await asyncio.gather(
+            *(
+                self._cancel_order_by_id(oid, orders[oid].cancel_payload or None)
+                for oid in trusted
+            ),
+            return_exceptions=True,
+        )
+        unsure = len(trusted) != len(order_ids) or any(
+            r is not True for r in results
+        )
+        if side is not None and unsure:
+            await self._cancel_side_via_query(side)
+        for oid in order_ids:
+            order = orders.pop(oid, None)
+            if order is not None:
+                self._archive_order(order)
+        self._orders_view_cache = None
+        self._recompute_earliest_placed()
+
+    async def _cancel_side_via_query(self, side: str) -> None:
+        """Sweep one side's live orders using exchange-queried ids.
+
+        Reduce-only orders are left alone — those are the TP/SL legs.
+        """
+        try:
+            open_orders = await self._fetch_open_orders()
+        except Exception as e:
+            log.error("engine.query_cancel_failed", error=str(e))
+            return
+        ids = [
+            o.get("order_id") or o.get("id")
+            for o in open_orders
+            if str(o.get("side", "")).lower() == side
+            and not o.get("reduce_only", False)
+        ]
+        if ids:
+            await asyncio.gather(
+                *(self._cancel_order_by_id(oid) for oid in ids if oid is not None),
+                return_exceptions=True,
+            )
+
+    @staticmethod
+    def _log_prefetch_failure(task: asyncio.Task) -> None:
+        """Done-callback that retrieves and logs a prefetch exception."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            log.debug("engine.prefetch_failed", error=str(exc))
+
+    async def _fetch_open_orders(self) -> list[dict]:
+        """Query the exchange for open orders on the current symbol."""
+        headers = await auth_manager.get_full_headers("")
+        resp = await self._client.get(
+            "/api/query_open_orders",
+            params={"symbol": settings.symbol},
+            headers=headers,
+        )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        return data.get("result", [])
+
+    async def _fetch_positions(self) -> list[dict]:
+        """Query the exchange for positions on the current symbol.
+
+        Handles both {result: [...]} / {data: [...]} and direct list
+        response shapes. The shape is sniffed once, then a specialized
+        extractor is reused; a shape change falls back to re-detection.
+        """
+        headers = await auth_manager.get_full_headers("")
+        resp = await self._client.get(
+            "/api/query_positions",
+            params={"symbol": settings.symbol},
+            headers=headers,
+        )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        if self._positions_extractor is not None:
+            try:
+                return self._positions_extractor(data)
+            except (KeyError, TypeError, AttributeError):
+                self._positions_extractor = None
+        if isinstance(data, list):
+            self._positions_extractor = lambda d: d
+            return data
+        if "result" in data:
+            self._positions_extractor = lambda d: d["result"]
+            return data["result"]
+        if "data" in data:
+            self._positions_extractor = lambda d: d["data"]
+            return data["data"]
+        return []
+
+    async def _cancel_all_orders(
+        self, prefetched: asyncio.Task | None = None
+    ) -> None:
         """Cancel all open orders on the exchange, then clear internal state.
-        
-        Queries the exchange for actual open orders and cancels each
-        using the integer order ID from the exchange.
+
+        Queries the exchange for actual open orders (or consumes a task
+        prefetched at tick start) and cancels each using the integer
+        order ID from the exchange.
         Never raises — cancel failures are logged but do not propagate.
         """
         cancelled = 0
         failed = 0
 
+        # 0. One bulk cancel beats N per-order round-trips on stop/kill.
+        # Probe once; a 404/405 disables further attempts this process.
+        if self._bulk_cancel_supported:
+            if await self._try_bulk_cancel():
+                if prefetched is not None:
+                    prefetched.cancel()
+                self._clear_order_tracking()
+                return
+
         try:
             # 1. Query exchange for real open orders
             try:
-                headers = await auth_manager.get_full_headers("")
-                resp = await self._client.get(
-                    "/api/query_open_orders",
-                    params={"symbol": settings.symbol},
-                    headers=headers,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                exchange_orders = data.get("result", [])
+                if prefetched is not None:
+                    exchange_orders = await prefetched
+                else:
+                    exchange_orders = await self._fetch_open_orders()
                 log.info("engine.fetched_open_orders", count=len(exchange_orders))
             except Exception as e:
                 log.error("engine.fetch_open_orders_failed", error=str(e))
                 exchange_orders = []
 
-            # 2. Cancel each order using integer ID
-            for order in exchange_orders:
-                exchange_id = order.get("id")
-                if exchange_id is not None:
-                    ok = await self._cancel_order_by_id(exchange_id)
-                    if ok:
+            # 2. Cancel all orders concurrently using their integer IDs —
+            # sequential awaits cost N round-trips on stop/kill.
+            exchange_ids = [
+                order["id"] for order in exchange_orders
+                if order.get("id") is not None
+            ]
+            if exchange_ids:
+                results = await asyncio.gather(
+                    *(self._cancel_order_by_id(eid) for eid in exchange_ids),
+                    return_exceptions=True,
+                )
+                for ok in results:
+                    if ok is True:
                         cancelled += 1
                     else:
                         failed += 1
@@ -482,13 +1105,54 @@ class TradingEngine:
             log.error("engine.cancel_all_error", error=str(e))
 
         # 3. Always clear internal order tracking, even if cancels failed
-        self._active_orders.clear()
+        self._clear_order_tracking()
+
+    async def _try_bulk_cancel(self) -> bool:
+        """Attempt a single symbol-wide cancel on the exchange.
+
+        Returns True when the venue accepted it; False (after marking
+        the endpoint unsupported on 404/405) to fall back to per-order
+        cancels.
+        """
+        payload = orjson.dumps({"symbol": settings.symbol})
+        try:
+            headers = await auth_manager.get_full_headers(payload)
+            headers["Content-Type"] = "application/json"
+            resp = await self._client.post(
+                "/api/cancel_all_orders",
+                content=payload,
+                headers=headers,
+            )
+            if resp.status_code in (404, 405):
+                log.warning("engine.bulk_cancel_unsupported")
+                self._bulk_cancel_supported = False
+                return False
+            resp.raise_for_status()
+            log.info("engine.bulk_cancel_done", symbol=settings.symbol)
+            return True
+        except Exception as e:
+            log.warning("engine.bulk_cancel_failed", error=str(e))
+            return False
+
+    def _clear_order_tracking(self) -> None:
+        """Archive and drop every tracked order, cancels notwithstanding."""
+        for book in (self._open_bids, self._open_asks):
+            for order in book.values():
+                self._archive_order(order)
+            book.clear()
+        self._orders_view_cache = None
+        self._earliest_placed_mono = math.inf
         log.info("engine.orders_cleared")
 
     # ─── Position Management ───────────────────────────────────────
 
-    async def _check_and_close_positions(self) -> None:
-        """Query open positions and manage TP/SL.
+    async def _check_and_close_positions(
+        self, positions: list[dict] | None = None
+    ) -> None:
+        """Process open positions and manage TP/SL.
+
+        Uses a caller-provided snapshot (e.g. from the WS cache) when
+        given; otherwise queries the REST endpoint.
 
         If TP/SL is configured (tp_usd/sl_usd > 0):
           - Check if reduce-only orders already exist for this position
@@ -497,26 +1161,8 @@ class TradingEngine:
         Otherwise: close with reduce_only market orders (taker fees).
         """
         try:
-            headers = await auth_manager.get_full_headers("")
-            resp = await self._client.get(
-                "/api/query_positions",
-                params={"symbol": settings.symbol},
-                headers=headers,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            # Handle both {result: [...]} and direct list response
-            if isinstance(data, list):
-                positions = data
-            else:
-                positions = data.get("result", data.get("data", []))
-
-            log.info(
-                "engine.position_query",
-                count=len(positions),
-                raw_keys=list(data.keys()) if isinstance(data, dict) else "list",
-            )
+            if positions is None:
+                positions = await self._fetch_positions()
 
             # Find non-zero position for our symbol
             active_pos = None
@@ -527,9 +1173,33 @@ class TradingEngine:
                 pos_symbol = pos.get("symbol", pos.get("instrument", ""))
                 if pos_symbol == settings.symbol and qty != 0:
                     active_pos = pos
-                    log.info("engine.position_found", raw_pos=str(pos)[:300])
                     break
 
+            # The common case is "same answer as last poll" (usually
+            # flat). Only the flat case may short-circuit: with a live
+            # position the TP/SL presence check (and the market-close
+            # fallback) must re-run every poll, because a full order
+            # refresh sweeps the reduce-only orders off the book while
+            # the position itself is unchanged. For an unchanged
+            # position we still skip the repeat logging below.
+            if active_pos is None:
+                pos_key = None
+            else:
+                pos_key = (
+                    float(qty_raw),
+                    float(active_pos.get("entry_price",
+                                         active_pos.get("avg_entry_price", 0))),
+                )
+            unchanged = pos_key == self._last_pos_key
+            if unchanged and active_pos is None:
+                return
+            self._last_pos_key = pos_key
+
+            if not unchanged:
+                log.info("engine.position_query", count=len(positions))
+                if active_pos is not None:
+                    log.info("engine.position_found", raw_pos=str(active_pos)[:300])
+
             if active_pos is None:
                 # No position — clean up any stale TP/SL tracking
                 if self._open_position is not None:
@@ -542,32 +1212,37 @@ class TradingEngine:
             qty_raw = active_pos.get("qty", active_pos.get("size", active_pos.get("position_qty", 0)))
             qty = float(qty_raw)
             entry_price = float(active_pos.get("entry_price", active_pos.get("avg_entry_price", 0)))
-            pos_side = "long" if qty > 0 else "short"
+            # One sign test covers side, close direction and magnitude.
+            if qty > 0:
+                pos_side, close_side, abs_qty = "long", "sell", qty
+            else:
+                pos_side, close_side, abs_qty = "short", "buy", -qty
 
             self._open_position = {
                 "side": pos_side,
-                "qty": abs(qty),
+                "qty": abs_qty,
                 "entry_price": entry_price,
             }
 
             # Check if TP/SL should be managed
             tp_sl_active = settings.tp_usd > 0 or settings.sl_usd > 0
             if tp_sl_active:
-                # Check if reduce-only orders already exist for this symbol
+                # Re-checked every poll even for an unchanged position —
+                # cancel-all refreshes remove the reduce-only orders.
                 has_tp_sl = await self._has_existing_tp_sl_orders()
                 if not has_tp_sl:
                     log.info(
                         "engine.placing_tp_sl",
                         side=pos_side,
-                        qty=abs(qty),
+                        qty=abs_qty,
                         entry_price=entry_price,
                     )
-                    await self._place_tp_sl_orders(entry_price, abs(qty), pos_side)
-                else:
+                    await self._place_tp_sl_orders(entry_price, abs_qty, pos_side)
+                elif not unchanged:
                     log.info(
                         "engine.tp_sl_already_exists",
                         side=pos_side,
-                        qty=abs(qty),
+                        qty=abs_qty,
                         entry_price=entry_price,
                     )
                 return
@@ -575,13 +1250,12 @@ class TradingEngine:
             log.warning(
                 "engine.position_detected",
                 side=pos_side,
-                qty=abs(qty),
+                qty=abs_qty,
                 entry_price=entry_price,
             )
 
             # No TP/SL configured — close with market order (fallback)
-            close_side = "sell" if qty > 0 else "buy"
-            await self._place_market_close(close_side, abs(qty))
+            await self._place_market_close(close_side, abs_qty)
 
         except Exception as e:
             log.error("engine.position_check_error", error=str(e))
@@ -589,15 +1263,7 @@ class TradingEngine:
     async def _has_existing_tp_sl_orders(self) -> bool:
         """Check if reduce-only orders already exist for this symbol."""
         try:
-            headers = await auth_manager.get_full_headers("")
-            resp = await self._client.get(
-                "/api/query_open_orders",
-                params={"symbol": settings.symbol},
-                headers=headers,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            orders = data.get("result", [])
+            orders = await self._fetch_open_orders()
 
             # Check if any reduce_only orders exist (these are our TP/SL)
             for order in orders:
@@ -615,11 +1281,10 @@ class TradingEngine:
 
         TP/SL are placed as GTC reduce-only limit orders on the opposite side.
         """
-        price_tick = PRICE_TICKS.get(settings.symbol, 0.01)
-        price_decimals = max(0, -int(math.log10(price_tick)))
-        tick = QTY_TICKS.get(settings.symbol, 0.0001)
-        qty_decimals = max(0, -int(math.log10(tick)))
-        rounded_qty = round(qty, qty_decimals)
+        price_tick = self._price_tick
+        price_decimals = self._price_decimals
+        tick = self._qty_tick
+        rounded_qty = round(qty, self._qty_decimals)
 
         if rounded_qty < tick:
             log.info("engine.tp_sl_qty_too_small", qty=qty, tick=tick)
@@ -667,27 +1332,25 @@ class TradingEngine:
     ) -> None:
         """Place a single reduce-only limit order (for TP or SL)."""
         payload = {
-            "symbol": settings.symbol,
+            **self._order_tmpl,
             "side": side,
-            "order_type": "limit",
-            "qty": str(qty),
-            "price": str(price),
-            "time_in_force": "gtc",
+            "qty": f"{qty:.{self._qty_decimals}f}",
+            "price": f"{price:.{self._price_decimals}f}",
             "reduce_only": True,
         }
-        payload_str = json.dumps(payload)
-        headers = await auth_manager.get_full_headers(payload_str)
+        payload_bytes = orjson.dumps(payload)
+        headers = await auth_manager.get_full_headers(payload_bytes)
         headers["Content-Type"] = "application/json"
 
         try:
             resp = await self._client.post(
                 "/api/new_order",
-                content=payload_str,
+                content=payload_bytes,
                 headers=headers,
             )
             resp.raise_for_status()
-            data = resp.json()
-            order_id = data.get("order_id", data.get("id", data.get("request_id", "unknown")))
+            data = orjson.loads(resp.content)
+            order_id = data.get("order_id") or data.get("id") or data.get("request_id") or "unknown"
             log.info(
                 f"engine.{label}_order_placed",
                 order_id=order_id,
@@ -725,7 +1388,7 @@ class TradingEngine:
                     headers=headers,
                 )
                 resp.raise_for_status()
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 trades = data.get("result", [])
 
                 if not trades:
@@ -755,9 +1418,8 @@ class TradingEngine:
     async def _place_market_close(self, side: str, qty: float) -> None:
         """Place a reduce_only market order to close a position."""
         # Round qty to symbol's tick size
-        tick = QTY_TICKS.get(settings.symbol, 0.0001)
-        decimals = max(0, -int(math.log10(tick)))
-        rounded_qty = round(qty, decimals)
+        tick = self._qty_tick
+        rounded_qty = round(qty, self._qty_decimals)
 
         if rounded_qty < tick:
             log.info("engine.position_too_small", qty=qty, tick=tick)
@@ -765,27 +1427,24 @@ class TradingEngine:
             return
 
         payload = {
-            "symbol": settings.symbol,
+            **self._market_close_tmpl,
             "side": side,
-            "order_type": "market",
-            "qty": str(rounded_qty),
-            "time_in_force": "ioc",
-            "reduce_only": True,
+            "qty": f"{rounded_qty:.{self._qty_decimals}f}",
         }
 
-        payload_str = json.dumps(payload)
-        headers = await auth_manager.get_full_headers(payload_str)
+        payload_bytes = orjson.dumps(payload)
+        headers = await auth_manager.get_full_headers(payload_bytes)
         headers["Content-Type"] = "application/json"
 
         try:
             resp = await self._client.post(
                 "/api/new_order",
-                content=payload_str,
+                content=payload_bytes,
                 headers=headers,
             )
             resp.raise_for_status()
-            data = resp.json()
-            order_id = data.get("order_id", data.get("id", "unknown"))
+            data = orjson.loads(resp.content)
+            order_id = data.get("order_id") or data.get("id") or "unknown"
             log.info(
                 "engine.position_closed",
                 order_id=order_id,
@@ -14,13 +14,19 @@ from dataclasses import dataclass
 
 from app.config import settings
 from app.logger import get_logger
+from app.trading._numeric import quote_terms
 
 log = get_logger("quote")
 
 
-@dataclass
+@dataclass(slots=True)
 class Quote:
-    """A two-sided quote."""
+    """A two-sided quote.
+
+    Deviations and the max-deviation verdict are computed once at
+    construction in ``QuoteGenerator.generate`` — they were properties
+    that re-divided on every read, and status polling reads them often.
+    """
     bid_price: float
     bid_size: float
     ask_price: float
@@ -29,26 +35,9 @@ class Quote:
     spread_bps: float        # Total spread (bid + ask)
     bid_spread_bps: float    # Bid-side half-spread
     ask_spread_bps: float    # Ask-side half-spread
-
-    @property
-    def bid_deviation_bps(self) -> float:
-        """Deviation of bid from mid in basis points."""
-        if self.mid_price == 0:
-            return 0.0
-        return (self.mid_price - self.bid_price) / self.mid_price * 10000.0
-
-    @property
-    def ask_deviation_bps(self) -> float:
-        """Deviation of ask from mid in basis points."""
-        if self.mid_price == 0:
-            return 0.0
-        return (self.ask_price - self.mid_price) / self.mid_price * 10000.0
-
-    @property
-    def is_within_max_deviation(self) -> bool:
-        """Check if both sides are within the max allowed deviation."""
-        max_dev = settings.max_spread_deviation_bps
-        return self.bid_deviation_bps <= max_dev and self.ask_deviation_bps <= max_dev
+    bid_deviation_bps: float = 0.0   # Deviation of bid from mid in bps
+    ask_deviation_bps: float = 0.0   # Deviation of ask from mid in bps
+    is_within_max_deviation: bool = True
 
     def to_dict(self) -> dict:
         return {
@@ -66,8 +55,61 @@ class Quote:
         }
 
 
+def _compute_quote(
+    mid_price: float,
+    base_spread: float,
+    b_notional: float,
+    a_notional: float,
+    max_dev: float,
+) -> Quote:
+    """Pure quote math on plain numbers — no settings access.
+
+    The arithmetic lives in the ``quote_terms`` kernel, which numba
+    JIT-compiles when installed; this wrapper only builds the Quote.
+    """
+    (
+        bid_price,
+        ask_price,
+        bid_size,
+        ask_size,
+        bid_deviation,
+        ask_deviation,
+    ) = quote_terms(mid_price, base_spread, b_notional, a_notional)
+
+    return Quote(
+        bid_price=bid_price,
+        bid_size=bid_size,
+        ask_price=ask_price,
+        ask_size=ask_size,
+        mid_price=mid_price,
+        spread_bps=base_spread * 2.0,
+        bid_spread_bps=base_spread,
+        ask_spread_bps=base_spread,
+        bid_deviation_bps=bid_deviation,
+        ask_deviation_bps=ask_deviation,
+        is_within_max_deviation=(
+            bid_deviation <= max_dev and ask_deviation <= max_dev
+        ),
+    )
+
+
 class QuoteGenerator:
-    """Generates symmetric two-sided quotes for maker uptime."""
+    """Generates symmetric two-sided quotes for maker uptime.
+
+    Settings are snapshotted at construction — generate() runs every
+    engine tick and pydantic attribute access is not free. Call
+    reconfigure() after a runtime config update.
+    """
+
+    def __init__(self) -> None:
+        self.reconfigure()
+
+    def reconfigure(self) -> None:
+        """Re-snapshot quoting parameters from settings."""
+        self._spread_bps = settings.spread_bps
+        self._bid_notional = settings.bid_notional
+        self._ask_notional = settings.ask_notional
+        self._max_dev = settings.max_spread_deviation_bps
 
     def generate(
         self,
@@ -82,39 +124,17 @@ class QuoteGenerator:
         Sizing:
             bid_size = bid_notional / mid_price
             ask_size = ask_notional / mid_price
+
+        Resolves the snapshotted settings, then delegates to the
+        pure module-level _compute_quote.
         """
-        base_spread = spread_bps if spread_bps is not None else settings.spread_bps
-
-        # Symmetric spread
-        bid_spread = base_spread
-        ask_spread = base_spread
-
-        # Calculate prices
-        bid_price = mid_price * (1.0 - bid_spread / 10000.0)
-        ask_price = mid_price * (1.0 + ask_spread / 10000.0)
-
-        # Calculate sizes from separate notionals
-        b_notional = bid_notional if bid_notional is not None else settings.bid_notional
-        a_notional = ask_notional if ask_notional is not None else settings.ask_notional
-
-        if mid_price > 0:
-            bid_size = b_notional / mid_price
-            ask_size = a_notional / mid_price
-        else:
-            bid_size = 0.0
-            ask_size = 0.0
-
-        total_spread = bid_spread + ask_spread
-
-        quote = Quote(
-            bid_price=bid_price,
-            bid_size=bid_size,
-            ask_price=ask_price,
-            ask_size=ask_size,
-            mid_price=mid_price,
-            spread_bps=total_spread,
-            bid_spread_bps=bid_spread,
-            ask_spread_bps=ask_spread,
+        base_spread = spread_bps if spread_bps is not None else self._spread_bps
+        b_notional = bid_notional if bid_notional is not None else self._bid_notional
+        a_notional = ask_notional if ask_notional is not None else self._ask_notional
+        max_dev = self._max_dev
+
+        quote = _compute_quote(
+            mid_price, base_spread, b_notional, a_notional, max_dev
         )
 
         if not quote.is_within_max_deviation:
@@ -122,11 +142,51 @@ class QuoteGenerator:
                 "quote.exceeds_max_deviation",
                 bid_dev=quote.bid_deviation_bps,
                 ask_dev=quote.ask_deviation_bps,
-                max_dev=settings.max_spread_deviation_bps,
+                max_dev=max_dev,
             )
 
         return quote
 
+    def generate_batch(
+        self,
+        mid_prices: "np.ndarray",
+        spread_bps: float | None = None,
+        bid_notional: float | None = None,
+        ask_notional: float | None = None,
+    ) -> dict[str, "np.ndarray"]:
+        """
+        Generate symmetric quotes for an array of mid prices in one pass.
+
+        Same math as generate(), vectorized with NumPy for a future
+        multi-symbol mode — the engine's single-symbol tick keeps the
+        scalar path. Zero mids produce zero prices/sizes, matching the
+        scalar behavior.
+        """
+        import numpy as np
+
+        base_spread = spread_bps if spread_bps is not None else self._spread_bps
+        b_notional = bid_notional if bid_notional is not None else self._bid_notional
+        a_notional = ask_notional if ask_notional is not None else self._ask_notional
+
+        mids = np.asarray(mid_prices, dtype=np.float64)
+        factor = base_spread / 10000.0
+        bid_prices = mids * (1.0 - factor)
+        ask_prices = mids * (1.0 + factor)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bid_sizes = np.where(mids > 0, b_notional / mids, 0.0)
+            ask_sizes = np.where(mids > 0, a_notional / mids, 0.0)
+        bid_prices = np.where(mids > 0, bid_prices, 0.0)
+        ask_prices = np.where(mids > 0, ask_prices, 0.0)
+
+        return {
+            "bid_price": bid_prices,
+            "bid_size": bid_sizes,
+            "ask_price": ask_prices,
+            "ask_size": ask_sizes,
+            "mid_price": mids,
+        }
+
 
 # Singleton
 quote_generator = QuoteGenerator()
@@ -6,6 +6,8 @@ Only tracks max notional exposure for safety.
 
 from __future__ import annotations
 
+import functools
+
 from app.config import settings
 from app.logger import get_logger
 
@@ -13,14 +15,36 @@ log = get_logger("risk")
 
 
 class RiskManager:
-    """Minimal risk manager for uptime-only bot."""
+    """Minimal risk manager for uptime-only bot.
+
+    Limits are snapshotted at construction — they're constants at
+    runtime, so per-check pydantic attribute access is avoidable.
+    Call reload_limits() after a config change.
+    """
+
+    def __init__(self) -> None:
+        self._max_notional = float(settings.max_notional)
+
+    def reload_limits(self) -> None:
+        """Re-read limits from settings after a runtime update."""
+        self._max_notional = float(settings.max_notional)
+
+    def check_can_place_order(self, side: str, size: float, price: float) -> bool:
+        """Notional guard: True when size * price fits under max_notional.
+
+        Pure comparison — the engine inlines the same math on its hot
+        path and only calls here at the boundary.
+        """
+        return size * price <= self._max_notional
 
     def get_status(self) -> dict:
         """Return risk status summary."""
         return {
-            "max_notional": settings.max_notional,
+            "max_notional": self._max_notional,
         }
 
 
-# Singleton
-risk_manager = RiskManager()
+@functools.lru_cache(maxsize=1)
+def get_risk_manager() -> RiskManager:
+    """Process-wide risk manager, built on first use instead of at import."""
+    return RiskManager()
@@ -17,10 +17,11 @@ Stores history for the last 24 hours.
 
 from __future__ import annotations
 
+import functools
 import time
 from collections import deque
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Callable
 
 from app.config import settings
 from app.logger import get_logger
@@ -31,15 +32,50 @@ log = get_logger("uptime")
 MAKER_MAX_SPREAD_BPS = 5.0
 
 
-@dataclass
+def _target_met(active_seconds: float, target_seconds: float) -> bool:
+    """Pure threshold check — module-level like quote's _compute_quote
+    so it can be tested without a tracker or settings."""
+    return active_seconds >= target_seconds
+
+
+@dataclass(slots=True)
 class HourlyRecord:
-    """Record for a single hour with dual counters."""
+    """Record for a single hour with dual counters.
+
+    Counters accumulate integer nanoseconds — hundreds of thousands of
+    float adds per hour would otherwise accrue rounding drift, and int
+    addition is native. Seconds are exposed via properties.
+    """
     hour_start: float
-    maker_active_seconds: float = 0.0     # spread ≤ 5 bps
-    mm_active_seconds: float = 0.0        # spread > 5 bps
-    total_elapsed_seconds: float = 0.0
+    maker_active_ns: int = 0              # spread ≤ 5 bps
+    mm_active_ns: int = 0                 # spread > 5 bps
+    total_elapsed_ns: int = 0
     target_seconds: float = 1800.0        # 30 minutes
 
+    @property
+    def maker_active_seconds(self) -> float:
+        return self.maker_active_ns / 1e9
+
+    @maker_active_seconds.setter
+    def maker_active_seconds(self, value: float) -> None:
+        self.maker_active_ns = int(value * 1e9)
+
+    @property
+    def mm_active_seconds(self) -> float:
+        return self.mm_active_ns / 1e9
+
+    @mm_active_seconds.setter
+    def mm_active_seconds(self, value: float) -> None:
+        self.mm_active_ns = int(value * 1e9)
+
+    @property
+    def total_elapsed_seconds(self) -> float:
+        return self.total_elapsed_ns / 1e9
+
+    @total_elapsed_seconds.setter
+    def total_elapsed_seconds(self, value: float) -> None:
+        self.total_elapsed_ns = int(value * 1e9)
+
     @property
     def maker_uptime_pct(self) -> float:
         """Maker uptime as percentage of the full hour (3600s)."""
@@ -52,7 +88,7 @@ class HourlyRecord:
 
     @property
     def maker_target_met(self) -> bool:
-        return self.maker_active_seconds >= self.target_seconds
+        return _target_met(self.maker_active_seconds, self.target_seconds)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -75,34 +111,59 @@ class UptimeTracker:
     mm_uptime    — both sides active AND spread > 5 bps
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        clock_ns: Callable[[], int] = time.monotonic_ns,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        # Injectable clocks — tests drive a fake clock instead of
+        # rewinding private timestamps against the real one.
+        self._clock_ns = clock_ns
+        self._wall_clock = wall_clock
         self._target_seconds = settings.uptime_target_minutes * 60.0
-        self._current_hour = self._get_current_hour()
+        self._current_hour = self._get_current_hour(wall_clock())
         self._current_record = HourlyRecord(
             hour_start=self._current_hour,
             target_seconds=self._target_seconds,
         )
-        self._history: deque[HourlyRecord] = deque(maxlen=24)
-        self._last_tick: float = time.time()
+        # Archived hours are kept as their serialized dicts — records
+        # are immutable once rolled over and only ever re-read by
+        # get_stats, so the dataclass instance has nothing left to add.
+        self._history: deque[dict[str, Any]] = deque(maxlen=24)
+        self._last_tick_ns: int = clock_ns()
         self._is_active = False
+        # Running aggregates over _history, maintained at rollover so
+        # get_stats stays O(1) instead of scanning the deque per call.
+        self._sum_maker_pct = 0.0
+        self._sum_mm_pct = 0.0
+        self._target_met_count = 0
 
     def reset(self) -> None:
         """Reset all uptime data. Used on symbol switch."""
-        self._current_hour = self._get_current_hour()
+        self._current_hour = self._get_current_hour(self._wall_clock())
         self._current_record = HourlyRecord(
             hour_start=self._current_hour,
             target_seconds=self._target_seconds,
         )
         self._history.clear()
-        self._last_tick = time.time()
+        self._last_tick_ns = self._clock_ns()
         self._is_active = False
+        self._sum_maker_pct = 0.0
+        self._sum_mm_pct = 0.0
+        self._target_met_count = 0
         log.info("uptime.reset")
 
     @staticmethod
-    def _get_current_hour() -> float:
-        """Return the timestamp of the start of the current hour."""
-        now = time.time()
-        return now - (now % 3600)
+    def _get_current_hour(now: float | None = None) -> float:
+        """Return the timestamp of the start of the current hour.
+
+        Integer floor-division — float modulo costs more in CPython and
+        second granularity is all that's needed here. Accepts an
+        already-captured clock reading to avoid a second syscall.
+        """
+        if now is None:
+            now = time.time()
+        return float(int(now) // 3600 * 3600)
 
     def tick(self, has_both_sides: bool, spread_bps: float = 0.0) -> None:
         """
@@ -112,27 +173,31 @@ class UptimeTracker:
             has_both_sides: True if bot has both bid and ask orders active.
             spread_bps: The configured spread at this moment.
         """
-        now = time.time()
-        elapsed = now - self._last_tick
+        # Monotonic clock for elapsed time — immune to NTP steps; the
+        # wall clock is only consulted for the hour boundary below.
+        now_ns = self._clock_ns()
+        elapsed_ns = now_ns - self._last_tick_ns
 
         # Cap elapsed to prevent huge jumps (e.g. after sleep/suspend)
-        elapsed = min(elapsed, 10.0)
+        elapsed_ns = min(elapsed_ns, 10_000_000_000)
 
-        self._last_tick = now
+        self._last_tick_ns = now_ns
+        now = self._wall_clock()
 
-        # Check for hour rollover
-        current_hour = self._get_current_hour()
-        if current_hour != self._current_hour:
-            self._rollover(current_hour)
+        # Check for hour rollover — a compare against the hour deadline
+        # beats recomputing the hour boundary on every tick; the branch
+        # is false for all but one tick per hour.
+        if now >= self._current_hour + 3600.0:
+            self._rollover(self._get_current_hour(now))
 
         # Update current record
-        self._current_record.total_elapsed_seconds += elapsed
+        self._current_record.total_elapsed_ns += elapsed_ns
 
         if has_both_sides:
             if spread_bps <= MAKER_MAX_SPREAD_BPS:
-                self._current_record.maker_active_seconds += elapsed
+                self._current_record.maker_active_ns += elapsed_ns
             else:
-                self._current_record.mm_active_seconds += elapsed
+                self._current_record.mm_active_ns += elapsed_ns
 
             if not self._is_active:
                 log.info("uptime.became_active", spread_bps=spread_bps)
@@ -153,7 +218,18 @@ class UptimeTracker:
             mm_pct=self._current_record.mm_uptime_pct,
             maker_target_met=self._current_record.maker_target_met,
         )
-        self._history.append(self._current_record)
+        # Keep the 24h running aggregates in step with the deque: the
+        # append below evicts the leftmost record once it holds 24.
+        if len(self._history) == self._history.maxlen:
+            evicted = self._history[0]
+            self._sum_maker_pct -= evicted["maker_uptime_pct"]
+            self._sum_mm_pct -= evicted["mm_uptime_pct"]
+            self._target_met_count -= evicted["maker_target_met"]
+        frozen = self._current_record.to_dict()
+        self._sum_maker_pct += frozen["maker_uptime_pct"]
+        self._sum_mm_pct += frozen["mm_uptime_pct"]
+        self._target_met_count += frozen["maker_target_met"]
+        self._history.append(frozen)
         self._current_hour = new_hour
         self._current_record = HourlyRecord(
             hour_start=new_hour,
@@ -179,7 +255,7 @@ class UptimeTracker:
 
     @property
     def seconds_elapsed_in_hour(self) -> float:
-        return time.time() - self._current_hour
+        return self._wall_clock() - self._current_hour
 
     def get_stats(self) -> dict[str, Any]:
         """Return comprehensive uptime statistics."""
@@ -190,24 +266,20 @@ class UptimeTracker:
                 "seconds_elapsed_in_hour": round(self.seconds_elapsed_in_hour, 2),
                 "is_active": self._is_active,
             },
-            "history": [r.to_dict() for r in self._history],
-            "hours_target_met_last_24h": sum(
-                1 for r in self._history if r.maker_target_met
-            ),
+            "history": list(self._history),
+            "hours_target_met_last_24h": self._target_met_count,
             "avg_maker_uptime_pct_last_24h": round(
-                sum(r.maker_uptime_pct for r in self._history) / len(self._history)
-                if self._history
-                else 0.0,
+                self._sum_maker_pct / len(self._history) if self._history else 0.0,
                 2,
             ),
             "avg_mm_uptime_pct_last_24h": round(
-                sum(r.mm_uptime_pct for r in self._history) / len(self._history)
-                if self._history
-                else 0.0,
+                self._sum_mm_pct / len(self._history) if self._history else 0.0,
                 2,
             ),
         }
 
 
-# Singleton
-uptime_tracker = UptimeTracker()
+@functools.lru_cache(maxsize=1)
+def get_uptime_tracker() -> UptimeTracker:
+    """Process-wide tracker, built on first use instead of at import."""
+    return UptimeTracker()
@@ -7,6 +7,7 @@ On "Start Bot" click: saves to .env, starts uvicorn, opens browser.
 """
 
 import os
+import re
 import sys
 import threading
 import time
@@ -26,19 +27,28 @@ def get_env_path() -> Path:
     return get_app_dir() / ".env"
 
 
+# KEY=value lines, tolerating surrounding whitespace; comments and blank
+# lines simply fail to match. One C-level sweep instead of per-line
+# strip/startswith/partition calls.
+_ENV_RE = re.compile(r"(?m)^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$")
+
+
 def read_env() -> dict[str, str]:
     """Read existing .env file into a dict."""
     env_path = get_env_path()
-    values: dict[str, str] = {}
-    if env_path.exists():
-        for line in env_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" in line:
-                key, _, val = line.partition("=")
-                values[key.strip()] = val.strip()
-    return values
+    if not env_path.exists():
+        return {}
+    try:
+        # python-dotenv ships with the server deps and handles quoting
+        # and exports properly; the regex stays as a fallback for a
+        # stripped-down environment.
+        from dotenv import dotenv_values
+    except ImportError:
+        return {
+            m.group(1): m.group(2)
+            for m in _ENV_RE.finditer(env_path.read_text(encoding="utf-8"))
+        }
+    return {k: v for k, v in dotenv_values(env_path).items() if v is not None}
 
 
 def write_env(jwt_token: str, private_key: str, wallet: str, chain: str) -> None:
@@ -66,7 +76,9 @@ def write_env(jwt_token: str, private_key: str, wallet: str, chain: str) -> None
         "MAX_NOTIONAL": "10000.0",
         "MAX_CONSECUTIVE_FAILURES": "5",
         "STALE_ORDER_SECONDS": "30",
+        "LOG_EVERY_SECONDS": "1.0",
         "MAX_SPREAD_DEVIATION_BPS": "200",
+        "POSITION_SYNC_INTERVAL": "1.0",
         "TP_USD": "0.0",
         "SL_USD": "0.0",
         "UPTIME_TARGET_MINUTES": "30",
@@ -74,8 +86,13 @@ def write_env(jwt_token: str, private_key: str, wallet: str, chain: str) -> None
     for k, v in defaults.items():
         existing.setdefault(k, v)
 
-    lines = [f"{k}={v}" for k, v in existing.items()]
-    env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # Write to a sibling temp file and rename into place — a crash
+    # mid-write can no longer leave a truncated .env behind.
+    tmp_path = env_path.with_name(env_path.name + ".tmp")
+    tmp_path.write_text(
+        "".join(f"{k}={v}\n" for k, v in existing.items()), encoding="utf-8"
+    )
+    os.replace(tmp_path, env_path)
 
 
 def start_server() -> None:
@@ -86,18 +103,37 @@ def start_server() -> None:
     # Set env file path for pydantic-settings
     os.environ["ENV_FILE"] = str(get_env_path())
 
-    # Brief delay then open browser
+    # Open the browser as soon as the server accepts connections
+    # instead of a fixed 3s sleep.
     def open_browser():
-        time.sleep(3)
+        import socket
+
+        deadline = time.time() + 15.0
+        while time.time() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", 8000), timeout=0.25):
+                    break
+            except OSError:
+                time.sleep(0.05)
         webbrowser.open("http://localhost:8000")
 
     threading.Thread(target=open_browser, daemon=True).start()
 
+    # Prefer uvloop for the engine's event loop — the trading loop is
+    # dominated by small async primitives where libuv dispatch is much
+    # cheaper than stock asyncio. Not available on Windows.
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
         log_level="info",
+        loop=loop_impl,
     )
 
 
@@ -115,6 +151,12 @@ class LauncherApp:
         y = (self.root.winfo_screenheight() - 500) // 2
         self.root.geometry(f"560x500+{x}+{y}")
 
+        # Defer widget/style construction to the first idle callback —
+        # the empty window paints immediately instead of waiting on the
+        # ttk style configuration.
+        self.root.after_idle(self._deferred_init)
+
+    def _deferred_init(self) -> None:
         self._build_ui()
         self._load_existing()
 
@@ -0,0 +1,13 @@
+"""Shared fixtures for the backend test suite."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _risk_settings():
+    # Pin the risk limits once for the whole run — every risk test
+    # assumes the same 10k notional cap, so there is no need to patch
+    # it per test.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.trading.risk.settings.max_notional", 10000.0)
+        yield
@@ -0,0 +1,31 @@
+"""Micro-benchmarks for the per-tick hot path.
+
+Disabled in normal runs via ``--benchmark-disable`` in pytest.ini;
+run ``pytest --benchmark-enable --benchmark-only`` to measure. Guards against regressions
+like an accidental Decimal conversion landing in generate().
+"""
+
+import pytest
+from app.trading.quote import QuoteGenerator
+from app.uptime.tracker import UptimeTracker
+
+
+@pytest.fixture(scope="module")
+def gen():
+    return QuoteGenerator()
+
+
+def test_generate_bench(benchmark, gen):
+    benchmark(
+        gen.generate,
+        1000.0,
+        5.0,
+        100.0,
+        100.0,
+    )
+
+
+def test_tick_bench(benchmark, monkeypatch):
+    monkeypatch.setattr("app.uptime.tracker.settings.uptime_target_minutes", 30)
+    tracker = UptimeTracker()
+    benchmark(tracker.tick, True, 5.0)
@@ -5,11 +5,18 @@ import pytest
 from app.market_data.orderbook import Orderbook
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def orderbook():
     return Orderbook(symbol="ETH-PERP")
 
 
+@pytest.fixture(autouse=True)
+def _clear_books(orderbook):
+    # Shared module-scoped instance — start each test from an empty book.
+    orderbook._bids.clear()
+    orderbook._asks.clear()
+
+
 @pytest.mark.asyncio
 async def test_empty_orderbook(orderbook):
     assert orderbook.mid_price is None
@@ -1,45 +1,65 @@
 """Tests for the QuoteGenerator module."""
 
 import pytest
-from unittest.mock import patch
+from math import isclose
+
 from app.trading.quote import QuoteGenerator
 
+# Canonical basic-quote inputs and their expected sides, computed once
+# at import instead of per test run.
+MID = 1000.0
+SPREAD_BPS = 5.0
+NOTIONAL = 100.0
+EXPECTED_BID = MID * (1 - SPREAD_BPS / 10000.0)
+EXPECTED_ASK = MID * (1 + SPREAD_BPS / 10000.0)
+EXPECTED_SIZE = NOTIONAL / MID
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gen():
+    # QuoteGenerator is stateless — one instance serves the module.
     return QuoteGenerator()
 
 
-def test_basic_quote(gen):
-    quote = gen.generate(mid_price=1000.0, spread_bps=5.0, bid_notional=100.0, ask_notional=100.0)
-    assert quote.bid_price == pytest.approx(1000.0 * (1 - 5.0 / 10000.0), rel=1e-8)
-    assert quote.ask_price == pytest.approx(1000.0 * (1 + 5.0 / 10000.0), rel=1e-8)
-    assert quote.bid_size == pytest.approx(0.1, rel=1e-8)
-    assert quote.ask_size == pytest.approx(0.1, rel=1e-8)
-    assert quote.mid_price == 1000.0
+@pytest.fixture(scope="module")
+def basic_quote(gen):
+    # generate() is pure — the tests that read this exact quote share
+    # one result instead of regenerating it.
+    return gen.generate(
+        mid_price=MID,
+        spread_bps=SPREAD_BPS,
+        bid_notional=NOTIONAL,
+        ask_notional=NOTIONAL,
+    )
+
+
+def test_basic_quote(basic_quote):
+    assert isclose(basic_quote.bid_price, EXPECTED_BID, rel_tol=1e-8)
+    assert isclose(basic_quote.ask_price, EXPECTED_ASK, rel_tol=1e-8)
+    assert isclose(basic_quote.bid_size, EXPECTED_SIZE, rel_tol=1e-8)
+    assert isclose(basic_quote.ask_size, EXPECTED_SIZE, rel_tol=1e-8)
+    assert basic_quote.mid_price == MID
 
 
 def test_spread_symmetry(gen):
     quote = gen.generate(mid_price=2000.0, spread_bps=3.0, bid_notional=2000.0, ask_notional=2000.0)
     bid_dev = abs(quote.mid_price - quote.bid_price)
     ask_dev = abs(quote.ask_price - quote.mid_price)
-    assert bid_dev == pytest.approx(ask_dev, rel=1e-8)
+    assert isclose(bid_dev, ask_dev, rel_tol=1e-8)
 
 
-def test_within_10bps(gen):
-    quote = gen.generate(mid_price=1000.0, spread_bps=5.0)
-    assert quote.is_within_max_deviation
+def test_within_10bps(basic_quote):
+    assert basic_quote.is_within_max_deviation
 
 
-def test_exceeds_10bps(gen):
+def test_exceeds_10bps(gen, monkeypatch):
     # With max_spread_deviation_bps=10, a 15 bps spread should exceed
-    with patch("app.trading.quote.settings") as mock_settings:
-        mock_settings.max_spread_deviation_bps = 10.0
-        mock_settings.spread_bps = 15.0
-        mock_settings.bid_notional = 100.0
-        mock_settings.ask_notional = 100.0
+    with monkeypatch.context() as mp:
+        mp.setattr("app.trading.quote.settings.max_spread_deviation_bps", 10.0)
+        gen.reconfigure()
         quote = gen.generate(mid_price=1000.0, spread_bps=15.0)
         assert not quote.is_within_max_deviation
+    gen.reconfigure()
 
 
 def test_zero_mid(gen):
@@ -49,9 +69,8 @@ def test_zero_mid(gen):
     assert quote.bid_deviation_bps == 0.0
 
 
-def test_to_dict(gen):
-    quote = gen.generate(mid_price=1500.0, spread_bps=5.0, bid_notional=750.0, ask_notional=750.0)
-    d = quote.to_dict()
+def test_to_dict(basic_quote):
+    d = basic_quote.to_dict()
     assert "bid_price" in d
     assert "ask_price" in d
     assert "within_limits" in d
@@ -61,5 +80,26 @@ def test_to_dict(gen):
 def test_notional_sizing(gen):
     """Verify bid_size = bid_notional / mid_price."""
     quote = gen.generate(mid_price=50000.0, bid_notional=100.0, ask_notional=200.0)
-    assert quote.bid_size == pytest.approx(0.002, rel=1e-8)
-    assert quote.ask_size == pytest.approx(0.004, rel=1e-8)
+    assert isclose(quote.bid_size, 0.002, rel_tol=1e-8)
+    assert isclose(quote.ask_size, 0.004, rel_tol=1e-8)
+
+
+def test_generate_sweep(gen):
+    """Sweep generate() across mids/spreads against a NumPy oracle."""
+    import numpy as np
+
+    mids = np.array([1000.0, 2000.0, 1500.0, 500.0, 123.45])
+    spreads = np.array([5.0, 3.0, 5.0, 1.0, 12.5])
+    quotes = [
+        gen.generate(m, s, bid_notional=100.0, ask_notional=100.0)
+        for m, s in zip(mids, spreads)
+    ]
+    np.testing.assert_allclose(
+        [q.bid_price for q in quotes], mids * (1 - spreads / 1e4), rtol=1e-9
+    )
+    np.testing.assert_allclose(
+        [q.ask_price for q in quotes], mids * (1 + spreads / 1e4), rtol=1e-9
+    )
+    np.testing.assert_allclose(
+        [q.bid_size for q in quotes], 100.0 / mids, rtol=1e-9
+    )
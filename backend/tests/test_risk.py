@@ -1,13 +1,23 @@
 """Tests for the RiskManager module (minimal, uptime-only)."""
 
-from unittest.mock import patch
+import pytest
 from app.trading.risk import RiskManager
 
 
-def test_get_status():
-    with patch("app.trading.risk.settings") as mock_settings:
-        mock_settings.max_notional = 10000.0
-        rm = RiskManager()
-        status = rm.get_status()
-        assert "max_notional" in status
-        assert status["max_notional"] == 10000.0
+@pytest.fixture(scope="module")
+def rm():
+    # Limits come from the session-wide _risk_settings fixture in
+    # conftest.py; the manager snapshots them at construction and no
+    # test mutates it, so one instance serves the module.
+    return RiskManager()
+
+
+def test_get_status(rm):
+    status = rm.get_status()
+    assert "max_notional" in status
+    assert status["max_notional"] == 10000.0
+
+
+def test_check_can_place_order(rm):
+    assert rm.check_can_place_order("buy", size=0.1, price=50000.0)
+    assert not rm.check_can_place_order("buy", size=0.5, price=50000.0)
@@ -1,17 +1,30 @@
 """Tests for the dual UptimeTracker module."""
 
-import time
 import pytest
-from unittest.mock import patch
-from app.uptime.tracker import UptimeTracker, MAKER_MAX_SPREAD_BPS
+from app.uptime.tracker import UptimeTracker, MAKER_MAX_SPREAD_BPS, _target_met
+
+
+class FakeClock:
+    """Manually advanced clock driving both tracker time sources."""
+
+    def __init__(self) -> None:
+        self.wall = 1_700_000_000.0
+        self.ns = 1_000_000_000_000
+
+    def advance(self, seconds: float) -> None:
+        self.wall += seconds
+        self.ns += int(seconds * 1e9)
 
 
 @pytest.fixture
-def tracker():
-    with patch("app.uptime.tracker.settings") as mock_settings:
-        mock_settings.uptime_target_minutes = 30
-        t = UptimeTracker()
-        yield t
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def tracker(monkeypatch, clock):
+    monkeypatch.setattr("app.uptime.tracker.settings.uptime_target_minutes", 30)
+    return UptimeTracker(clock_ns=lambda: clock.ns, wall_clock=lambda: clock.wall)
 
 
 def test_initial_state(tracker):
@@ -20,50 +33,54 @@ def test_initial_state(tracker):
     assert not tracker.is_maker_target_met
 
 
-def test_tick_maker_spread(tracker):
+def test_tick_maker_spread(tracker, clock):
     """spread ≤ 5 bps → maker counter increments"""
-    tracker._last_tick = time.time() - 10.0
+    clock.advance(10.0)
     tracker.tick(has_both_sides=True, spread_bps=5.0)
-    assert tracker._current_record.maker_active_seconds >= 9.0
-    assert tracker._current_record.mm_active_seconds < 1.0
+    assert tracker._current_record.maker_active_seconds == 10.0
+    assert tracker._current_record.mm_active_seconds == 0.0
 
 
-def test_tick_mm_spread(tracker):
+def test_tick_mm_spread(tracker, clock):
     """spread > 5 bps → mm counter increments"""
-    tracker._last_tick = time.time() - 10.0
+    clock.advance(10.0)
     tracker.tick(has_both_sides=True, spread_bps=50.0)
-    assert tracker._current_record.mm_active_seconds >= 9.0
-    assert tracker._current_record.maker_active_seconds < 1.0
+    assert tracker._current_record.mm_active_seconds == 10.0
+    assert tracker._current_record.maker_active_seconds == 0.0
 
 
-def test_tick_inactive(tracker):
+def test_tick_inactive(tracker, clock):
     """No orders → neither counter increments"""
-    tracker._last_tick = time.time() - 10.0
+    clock.advance(10.0)
     tracker.tick(has_both_sides=False, spread_bps=5.0)
-    assert tracker._current_record.maker_active_seconds < 1.0
-    assert tracker._current_record.mm_active_seconds < 1.0
+    assert tracker._current_record.maker_active_seconds == 0.0
+    assert tracker._current_record.mm_active_seconds == 0.0
 
 
-def test_elapsed_capped(tracker):
+def test_elapsed_capped(tracker, clock):
     """Elapsed should be capped at 10s to prevent jumps after sleep."""
-    tracker._last_tick = time.time() - 300.0  # 5 minutes ago
+    clock.advance(300.0)  # 5 minutes
     tracker.tick(has_both_sides=True, spread_bps=5.0)
-    assert tracker._current_record.maker_active_seconds <= 10.0
+    assert tracker._current_record.maker_active_seconds == 10.0
 
 
-def test_maker_target_met(tracker):
-    tracker._current_record.maker_active_seconds = 1800.0
-    assert tracker.is_maker_target_met
+@pytest.mark.parametrize(
+    "seconds,target,expected",
+    [(1800.0, 1800.0, True), (1799.0, 1800.0, False)],
+)
+def test_maker_target(seconds, target, expected):
+    # Pure helper — no tracker or settings needed for the boundary.
+    assert _target_met(seconds, target) is expected
 
 
-def test_maker_target_not_met(tracker):
-    tracker._current_record.maker_active_seconds = 1799.0
-    assert not tracker.is_maker_target_met
+def test_maker_target_wired(tracker):
+    tracker._current_record.maker_active_seconds = 1800.0
+    assert tracker.is_maker_target_met
 
 
 def test_seconds_remaining(tracker):
     tracker._current_record.maker_active_seconds = 1000.0
-    assert tracker.seconds_remaining_for_target == pytest.approx(800.0, abs=1.0)
+    assert tracker.seconds_remaining_for_target == 800.0
 
 
 def test_get_stats(tracker):
@@ -75,14 +92,14 @@ def test_get_stats(tracker):
     assert "avg_mm_uptime_pct_last_24h" in stats
 
 
-def test_rollover(tracker):
-    tracker._current_hour = time.time() - 7200
+def test_rollover(tracker, clock):
     tracker._current_record.maker_active_seconds = 1500.0
     tracker._current_record.mm_active_seconds = 500.0
+    clock.advance(7200.0)
     tracker.tick(has_both_sides=True, spread_bps=5.0)
     assert len(tracker._history) == 1
-    assert tracker._history[0].maker_active_seconds == 1500.0
-    assert tracker._history[0].mm_active_seconds == 500.0
+    assert tracker._history[0]["maker_active_seconds"] == 1500.0
+    assert tracker._history[0]["mm_active_seconds"] == 500.0
 
 
 def test_reset(tracker):
@@ -94,9 +111,9 @@ def test_reset(tracker):
     assert len(tracker._history) == 0
 
 
-def test_boundary_spread(tracker):
+def test_boundary_spread(tracker, clock):
     """Exactly 5 bps → should count as maker."""
-    tracker._last_tick = time.time() - 5.0
+    clock.advance(5.0)
     tracker.tick(has_both_sides=True, spread_bps=MAKER_MAX_SPREAD_BPS)
-    assert tracker._current_record.maker_active_seconds >= 4.0
-    assert tracker._current_record.mm_active_seconds < 1.0
+    assert tracker._current_record.maker_active_seconds == 5.0
+    assert tracker._current_record.mm_active_seconds == 0.0
@@ -38,6 +38,8 @@ a = Analysis(
         'app.trading',
         'app.trading.engine',
         'app.trading.quote',
+        'app.trading.risk',
+        'app.trading._numeric',
         'app.uptime',
         'app.uptime.tracker',
         'app.api',
@@ -74,7 +76,6 @@ a = Analysis(
         'cffi',
         '_cffi_backend',
         'base58',
-        'tenacity',
         'dotenv',
         'email.mime.text',
         'cryptography',